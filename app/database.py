@@ -21,7 +21,7 @@ user profiles, and audit logs stored in ``gatekeeper_local.db`` are readable
 by any process or user with file-system access to the database file.
 
 Current mitigations:
-- Sensitive auth tokens are AES-256-GCM encrypted in the
+- Sensitive auth tokens are ChaCha20-Poly1305 encrypted in the
   ``encrypted_sessions`` table (see ``SessionCacheService``).
 - Rate-limit state is HMAC-signed to detect file-level tampering.
 - The application targets corporate Windows desktops with NTFS ACLs
@@ -55,10 +55,38 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator, Optional
 
-from supabase import create_client, Client as SupabaseClient
+import httpx
+from supabase import create_client, Client as SupabaseClient, ClientOptions
 
 from app.logger import StructuredLogger
 
+# ``fastrlock`` is a C-implemented re-entrant lock that is much cheaper
+# to acquire/release than ``threading.RLock`` when uncontended — the
+# common case here (one sync worker plus occasional main-thread
+# writes).  Fall back to the stdlib lock when the wheel is unavailable.
+try:
+    from fastrlock.rlock import FastRLock as WriteLock
+except ImportError:
+    from threading import RLock as WriteLock
+
+# Size of the per-connection prepared-statement cache.  Services hoist
+# their SQL text to module-level constants so repeated calls hit this
+# cache instead of re-parsing the statement.
+_STATEMENT_CACHE_SIZE: int = 128
+
+# Memory-map window for read-only connections (256 MiB).  Reads of pages
+# inside the window skip the read() syscall and the page-cache copy.
+_READER_MMAP_SIZE: int = 256 * 1024 * 1024
+
+# Shared HTTP connection pool for every Supabase sub-client (PostgREST,
+# auth, storage).  The keep-alive expiry outlasts the sync worker's 30 s
+# poll so consecutive cycles reuse the same TLS connection instead of
+# re-handshaking; HTTP/2 lets the worker's concurrent replays multiplex
+# over it.
+_HTTP_MAX_CONNECTIONS: int = 16
+_HTTP_KEEPALIVE_EXPIRY_S: float = 60.0
+_HTTP_TIMEOUT_S: float = 120.0  # postgrest-py's default request timeout
+
 
 class DatabaseManager:
     """Manages connections to the local SQLite database and cloud Supabase instance.
@@ -95,14 +123,30 @@ class DatabaseManager:
         logger: StructuredLogger,
     ) -> None:
         self._logger: StructuredLogger = logger
-        self._write_lock: threading.RLock = threading.RLock()
+        self._write_lock: WriteLock = WriteLock()
         self._in_batch: bool = False
+        self._sync_work_available: threading.Event = threading.Event()
 
         # --- Supabase (optional — offline-first) ---
         self._supabase: Optional[SupabaseClient] = None
+        self._http_client: Optional[httpx.Client] = None
         if supabase_url and supabase_key:
             try:
-                self._supabase = create_client(supabase_url, supabase_key)
+                self._http_client = httpx.Client(
+                    http2=True,
+                    timeout=_HTTP_TIMEOUT_S,
+                    follow_redirects=True,
+                    limits=httpx.Limits(
+                        max_connections=_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=_HTTP_MAX_CONNECTIONS,
+                        keepalive_expiry=_HTTP_KEEPALIVE_EXPIRY_S,
+                    ),
+                )
+                self._supabase = create_client(
+                    supabase_url,
+                    supabase_key,
+                    options=ClientOptions(httpx_client=self._http_client),
+                )
                 self._logger.info("Supabase client initialized.")
             except (ValueError, TypeError) as exc:
                 self._logger.warning(
@@ -122,6 +166,7 @@ class DatabaseManager:
             )
 
         # --- SQLite (always required) ---
+        self._sqlite_path: Path = sqlite_path
         self._sqlite_conn: sqlite3.Connection = self._connect_sqlite(sqlite_path)
 
     # ------------------------------------------------------------------
@@ -157,7 +202,7 @@ class DatabaseManager:
         return self._sqlite_conn
 
     @property
-    def write_lock(self) -> threading.RLock:
+    def write_lock(self) -> WriteLock:
         """Return the write lock for thread-safe SQLite operations.
 
         All code that performs SQLite writes (INSERT, UPDATE, DELETE,
@@ -167,9 +212,28 @@ class DatabaseManager:
             with db.write_lock:
                 db.sqlite.execute("INSERT ...")
                 db.sqlite.commit()
+
+        Reads on the shared connection take the same exclusive lock on
+        purpose.  Every thread uses one ``sqlite3.Connection``, which
+        SQLite already serialises internally, so a shared/exclusive
+        (reader-writer) lock would not let two reads run in parallel —
+        it would only let a read execute inside another thread's open,
+        uncommitted write transaction on that connection.  Reads that
+        must not wait on writers need their own connection (WAL mode
+        lets it read the last committed snapshot concurrently).
         """
         return self._write_lock
 
+    @property
+    def sync_work_available(self) -> threading.Event:
+        """Event set whenever a row is added to ``sync_queue``.
+
+        Repositories set it after enqueuing; ``SyncWorkerService`` waits
+        on it so fresh work is replayed without waiting out the full
+        poll interval.
+        """
+        return self._sync_work_available
+
     @property
     def in_batch(self) -> bool:
         """``True`` when a :meth:`batch_write` context is active.
@@ -219,6 +283,38 @@ class DatabaseManager:
         finally:
             self._in_batch = False
 
+    def open_reader(self) -> sqlite3.Connection:
+        """Open a private read-only connection to the local database.
+
+        In WAL mode a separate connection reads the last committed
+        snapshot without waiting on :pyattr:`write_lock` or on writes in
+        progress on the shared connection.  The connection is not
+        shared with any other component, so it may be used from any
+        single thread at a time; the caller must close it.
+
+        Rows are returned as plain tuples (no ``row_factory``).
+
+        Returns
+        -------
+        sqlite3.Connection
+            A ``mode=ro`` connection to the same database file.
+
+        Raises
+        ------
+        sqlite3.OperationalError
+            If the database file cannot be opened.
+        """
+        uri = f"{self._sqlite_path.resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(
+            uri,
+            uri=True,
+            check_same_thread=False,
+            cached_statements=_STATEMENT_CACHE_SIZE,
+        )
+        conn.execute("PRAGMA temp_store=MEMORY;")
+        conn.execute(f"PRAGMA mmap_size={_READER_MMAP_SIZE};")
+        return conn
+
     # ------------------------------------------------------------------
     # Lifecycle helpers
     # ------------------------------------------------------------------
@@ -244,10 +340,13 @@ class DatabaseManager:
                 return 0
 
     def close(self) -> None:
-        """Close the local SQLite connection.
+        """Close the local SQLite connection and the Supabase HTTP pool.
 
         Safe to call multiple times; subsequent calls are no-ops.
         """
+        if self._http_client is not None:
+            self._http_client.close()
+
         with self._write_lock:
             if self._sqlite_conn is not None:
                 try:
@@ -285,10 +384,19 @@ class DatabaseManager:
             If the OS denies access to the database file or its directory.
         """
         try:
-            conn = sqlite3.connect(str(path), check_same_thread=False)
+            conn = sqlite3.connect(
+                str(path),
+                check_same_thread=False,
+                cached_statements=_STATEMENT_CACHE_SIZE,
+            )
             conn.row_factory = sqlite3.Row
             # Enable WAL mode for better concurrent read performance.
             conn.execute("PRAGMA journal_mode=WAL;")
+            # In WAL mode NORMAL only fsyncs at checkpoints; committed
+            # transactions stay durable across application crashes and
+            # small single-row writes (session cache, sync queue) no
+            # longer pay an fsync each.
+            conn.execute("PRAGMA synchronous=NORMAL;")
             conn.execute("PRAGMA foreign_keys = ON;")
             self._logger.info("SQLite database opened at %s", path)
             return conn
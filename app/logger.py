@@ -146,6 +146,14 @@ class StructuredLogger:
 
     # -- Convenience delegates ------------------------------------------------
 
+    def isEnabledFor(self, level: int) -> bool:  # noqa: N802 — mirrors logging API
+        """Return ``True`` if a record at *level* would be emitted.
+
+        Lets hot loops skip building log arguments entirely when the
+        level is disabled.
+        """
+        return self._logger.isEnabledFor(level)
+
     def debug(self, msg: str, *args: object, **kwargs: object) -> None:
         self._logger.debug(msg, *args, **kwargs)
 
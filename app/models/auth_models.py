@@ -186,12 +186,14 @@ class CachedSession(BaseModel):
     refresh_token:
         The Supabase refresh token used to obtain new access tokens.
     cached_at:
-        ISO-8601 UTC timestamp indicating when the session was cached.
+        Unix epoch seconds (UTC) indicating when the session was cached.
+        Stored as an integer so the expiry check is a single subtraction
+        against ``time.time()`` instead of an ISO-8601 parse.
     password_hash:
-        Hex-encoded PBKDF2-HMAC-SHA256 hash for offline password
+        Raw 32-byte PBKDF2-HMAC-SHA256 digest for offline password
         verification.  ``None`` when offline login is disabled.
     password_salt:
-        Hex-encoded random 32-byte salt paired with *password_hash*.
+        Raw random 32-byte salt paired with *password_hash*.
     """
 
     user_id: str
@@ -199,8 +201,8 @@ class CachedSession(BaseModel):
     full_name: str
     role: UserRole
     refresh_token: str
-    cached_at: str  # ISO-8601 UTC
-    password_hash: Optional[str] = None
-    password_salt: Optional[str] = None
+    cached_at: int  # Unix epoch seconds
+    password_hash: Optional[bytes] = None
+    password_salt: Optional[bytes] = None
 
     model_config = {"from_attributes": True}
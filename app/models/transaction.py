@@ -17,6 +17,9 @@ from app.models.fixed_cost import FixedCost
 from app.models.recurring_service import RecurringService
 from app.utils.string_helpers import normalize_keys
 
+# Relationship lists that ``to_financial_engine_dict`` serialises itself.
+_DETAIL_FIELDS: set[str] = {"fixed_costs", "recurring_services"}
+
 
 class MasterVariablesSnapshot(BaseModel):
     """Frozen snapshot of master variables at transaction creation time."""
@@ -49,16 +52,27 @@ class FinancialCache(BaseModel):
     gross_margin_ratio: Optional[Decimal] = None
     costo_carta_fianza: Optional[Decimal] = None
     aplica_carta_fianza: Optional[bool] = None
+    # periods / net_cash_flow are lists; revenues / expenses are dicts of
+    # lists, with expenses.fixed_costs holding one dict per cost item.
     timeline: Optional[
         dict[
             str,
             Union[
                 list[Decimal],
                 list[str],
-                list[dict[str, Union[Decimal, int, str, None, list[Decimal]]]],
+                dict[
+                    str,
+                    Union[
+                        list[Decimal],
+                        list[dict[str, Union[Decimal, int, str, None, list[Decimal]]]],
+                    ],
+                ],
             ],
         ]
     ] = None
+    # SHA-256 of the engine input these metrics were computed from; lets
+    # approval skip the engine when nothing has changed since.
+    input_hash: Optional[str] = None
 
     model_config = {"from_attributes": True}
 
@@ -158,9 +172,12 @@ class Transaction(BaseModel):
             A dict containing the transaction's scalar fields plus serialised
             ``fixed_costs`` and ``recurring_services`` lists.
         """
-        data: dict[str, object] = self.model_dump()
-        data["fixed_costs"] = [fc.model_dump() for fc in self.fixed_costs]
-        data["recurring_services"] = [rs.model_dump() for rs in self.recurring_services]
+        # The detail lists are rebuilt below, so skip dumping them twice.
+        # Their models hold only scalar fields: a shallow ``__dict__``
+        # copy equals ``model_dump()`` without the serializer pass.
+        data: dict[str, object] = self.model_dump(exclude=_DETAIL_FIELDS)
+        data["fixed_costs"] = [dict(fc.__dict__) for fc in self.fixed_costs]
+        data["recurring_services"] = [dict(rs.__dict__) for rs in self.recurring_services]
         data["gigalan_region"] = self.gigalan_region
         data["gigalan_sale_type"] = self.gigalan_sale_type
         data["gigalan_old_mrc"] = self.gigalan_old_mrc
@@ -12,7 +12,7 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from typing import Callable, Optional, TypeVar, Union
+from typing import Callable, Final, Optional, TypeVar, Union
 
 from supabase import Client as SupabaseClient
 
@@ -22,6 +22,15 @@ from app.utils.string_helpers import JsonValue
 
 T = TypeVar("T")
 
+# Compact separators: queued payloads are stored as-is and later sent
+# verbatim as the PostgREST request body, so whitespace is pure overhead.
+_PAYLOAD_SEPARATORS: Final[tuple[str, str]] = (",", ":")
+
+_SQL_ENQUEUE_SYNC: Final[str] = """
+    INSERT INTO sync_queue (table_name, operation, entity_id, payload)
+    VALUES (?, ?, ?, ?)
+"""
+
 
 class BaseRepository:
     """Base class for all repositories. Receives dependencies via __init__."""
@@ -144,13 +153,16 @@ class BaseRepository:
         """
         try:
             self.sqlite.execute(
-                """
-                INSERT INTO sync_queue (table_name, operation, entity_id, payload)
-                VALUES (?, ?, ?, ?)
-                """,
-                (self.TABLE, operation, entity_id, json.dumps(payload, default=str)),
+                _SQL_ENQUEUE_SYNC,
+                (
+                    self.TABLE,
+                    operation,
+                    entity_id,
+                    json.dumps(payload, default=str, separators=_PAYLOAD_SEPARATORS),
+                ),
             )
             self._commit()
+            self._db.sync_work_available.set()
             self._logger.info(
                 "Queued pending sync: %s %s/%s", operation, self.TABLE, entity_id
             )
@@ -161,58 +173,3 @@ class BaseRepository:
                 entity_id,
                 exc,
             )
-
-    def _mark_synced(self, queue_id: int) -> None:
-        """Transition a sync-queue row from ``pending`` to ``synced``.
-
-        Parameters
-        ----------
-        queue_id:
-            The ``id`` (primary key) of the ``sync_queue`` row.
-        """
-        try:
-            self.sqlite.execute(
-                """
-                UPDATE sync_queue
-                SET status = 'synced', attempted_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (queue_id,),
-            )
-            self._commit()
-        except sqlite3.Error as exc:
-            self._logger.warning(
-                "Failed to mark sync_queue row %d as synced: %s",
-                queue_id,
-                exc,
-            )
-
-    def _mark_failed(self, queue_id: int, error_message: str) -> None:
-        """Transition a sync-queue row from ``pending`` to ``failed``.
-
-        Parameters
-        ----------
-        queue_id:
-            The ``id`` (primary key) of the ``sync_queue`` row.
-        error_message:
-            Human-readable description of the failure (stored in the
-            ``error_message`` column for diagnostics).
-        """
-        try:
-            self.sqlite.execute(
-                """
-                UPDATE sync_queue
-                SET status = 'failed',
-                    attempted_at = CURRENT_TIMESTAMP,
-                    error_message = ?
-                WHERE id = ?
-                """,
-                (error_message, queue_id),
-            )
-            self._commit()
-        except sqlite3.Error as exc:
-            self._logger.warning(
-                "Failed to mark sync_queue row %d as failed: %s",
-                queue_id,
-                exc,
-            )
@@ -186,6 +186,16 @@ class FixedCostRepository(BaseRepository):
             )
             return costs
 
+    def cache_for_transaction(
+        self, transaction_id: str, costs: list[FixedCost]
+    ) -> None:
+        """Mirror rows already written to Supabase into the SQLite cache.
+
+        Used after ``TransactionRepository.create_with_details`` inserted
+        the detail rows server-side; nothing is queued for sync.
+        """
+        self._replace_in_sqlite(transaction_id, costs)
+
     def _replace_in_sqlite(
         self, transaction_id: str, costs: list[FixedCost]
     ) -> None:
@@ -194,15 +204,15 @@ class FixedCostRepository(BaseRepository):
             f"DELETE FROM {self.TABLE} WHERE transaction_id = ?",
             (transaction_id,),
         )
-        for cost in costs:
-            self.sqlite.execute(
-                f"""
-                INSERT INTO {self.TABLE}
-                    (transaction_id, categoria, tipo_servicio, ticket, ubicacion,
-                     cantidad, costo_unitario_original, costo_unitario_currency,
-                     costo_unitario_pen, periodo_inicio, duracion_meses)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self.sqlite.executemany(
+            f"""
+            INSERT INTO {self.TABLE}
+                (transaction_id, categoria, tipo_servicio, ticket, ubicacion,
+                 cantidad, costo_unitario_original, costo_unitario_currency,
+                 costo_unitario_pen, periodo_inicio, duracion_meses)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
                 (
                     transaction_id,
                     cost.categoria,
@@ -215,7 +225,9 @@ class FixedCostRepository(BaseRepository):
                     float(cost.costo_unitario_pen) if isinstance(cost.costo_unitario_pen, Decimal) else cost.costo_unitario_pen,
                     float(cost.periodo_inicio) if isinstance(cost.periodo_inicio, Decimal) else cost.periodo_inicio,
                     float(cost.duracion_meses) if isinstance(cost.duracion_meses, Decimal) else cost.duracion_meses,
-                ),
-            )
+                )
+                for cost in costs
+            ),
+        )
         self._commit()
 
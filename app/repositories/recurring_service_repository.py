@@ -189,6 +189,16 @@ class RecurringServiceRepository(BaseRepository):
             )
             return services
 
+    def cache_for_transaction(
+        self, transaction_id: str, services: list[RecurringService]
+    ) -> None:
+        """Mirror rows already written to Supabase into the SQLite cache.
+
+        Used after ``TransactionRepository.create_with_details`` inserted
+        the detail rows server-side; nothing is queued for sync.
+        """
+        self._replace_in_sqlite(transaction_id, services)
+
     def _replace_in_sqlite(
         self, transaction_id: str, services: list[RecurringService]
     ) -> None:
@@ -197,17 +207,17 @@ class RecurringServiceRepository(BaseRepository):
             f"DELETE FROM {self.TABLE} WHERE transaction_id = ?",
             (transaction_id,),
         )
-        for svc in services:
-            self.sqlite.execute(
-                f"""
-                INSERT INTO {self.TABLE}
-                    (transaction_id, tipo_servicio, nota, ubicacion, quantity,
-                     price_original, price_currency, price_pen,
-                     cost_unit_1_original, cost_unit_2_original,
-                     cost_unit_currency, cost_unit_1_pen, cost_unit_2_pen,
-                     proveedor)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self.sqlite.executemany(
+            f"""
+            INSERT INTO {self.TABLE}
+                (transaction_id, tipo_servicio, nota, ubicacion, quantity,
+                 price_original, price_currency, price_pen,
+                 cost_unit_1_original, cost_unit_2_original,
+                 cost_unit_currency, cost_unit_1_pen, cost_unit_2_pen,
+                 proveedor)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
                 (
                     transaction_id,
                     svc.tipo_servicio,
@@ -223,7 +233,9 @@ class RecurringServiceRepository(BaseRepository):
                     float(svc.cost_unit_1_pen) if isinstance(svc.cost_unit_1_pen, Decimal) else svc.cost_unit_1_pen,
                     float(svc.cost_unit_2_pen) if isinstance(svc.cost_unit_2_pen, Decimal) else svc.cost_unit_2_pen,
                     svc.proveedor,
-                ),
-            )
+                )
+                for svc in services
+            ),
+        )
         self._commit()
 
@@ -8,21 +8,35 @@ Provides aggregation methods for KPI calculations.
 
 from __future__ import annotations
 
-import json
 import math
 import sqlite3
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Optional, TypedDict
 
+import httpx
+import orjson
+from postgrest.exceptions import APIError
+
 from app.database import DatabaseManager
 from app.logger import StructuredLogger
 from app.models.enums import ApprovalStatus
+from app.models.fixed_cost import FixedCost
+from app.models.recurring_service import RecurringService
 from app.models.transaction import Transaction
 from app.repositories.base_repository import BaseRepository
 from app.utils.string_helpers import sanitize_postgrest_value
 
 
+def _dumps_json(value: object) -> str:
+    """Serialise a JSON column (snapshot / financial cache) with orjson.
+
+    Decimals become strings, as ``json.dumps(..., default=str)`` did;
+    the output is compact and produced in C.
+    """
+    return orjson.dumps(value, default=str).decode()
+
+
 class PaginatedTransactions(TypedDict):
     """Typed return value for paginated transaction queries."""
 
@@ -57,6 +71,20 @@ class TransactionRepository(BaseRepository):
 
     TABLE = "transactions"
 
+    # Supabase function (migration 005) inserting header + details atomically.
+    _CREATE_WITH_DETAILS_RPC = "create_transaction_with_details"
+
+    # PostgREST error code for "function not found" (migration not applied).
+    _RPC_NOT_FOUND_CODE: str = "PGRST202"
+
+    # Failures raised before the request reached the server, so the RPC
+    # cannot have committed anything.
+    _RPC_NOT_SENT_ERRORS: tuple[type[Exception], ...] = (
+        httpx.ConnectError,
+        httpx.ConnectTimeout,
+        httpx.PoolTimeout,
+    )
+
     def __init__(self, db: DatabaseManager, logger: StructuredLogger) -> None:
         super().__init__(db, logger)
 
@@ -85,6 +113,51 @@ class TransactionRepository(BaseRepository):
             operation_name="get_by_id (transactions)",
         )
 
+    def get_relationships(
+        self, transaction_id: str,
+    ) -> tuple[list[FixedCost], list[RecurringService]]:
+        """Fetch a transaction's fixed costs and recurring services together.
+
+        Supabase embeds both detail tables (foreign keys from migration
+        004) in a single request instead of one per table; the SQLite
+        fallback runs both selects back to back on the shared connection.
+        """
+        def _supabase() -> Optional[tuple[list[FixedCost], list[RecurringService]]]:
+            response = (
+                self.supabase.table(self.TABLE)
+                .select("fixed_costs(*), recurring_services(*)")
+                .eq("id", transaction_id)
+                .maybe_single()
+                .execute()
+            )
+            if response is None or not response.data:
+                return None
+            return (
+                [FixedCost(**row) for row in response.data["fixed_costs"]],
+                [RecurringService(**row) for row in response.data["recurring_services"]],
+            )
+
+        def _sqlite() -> tuple[list[FixedCost], list[RecurringService]]:
+            fc_rows = self.sqlite.execute(
+                "SELECT * FROM fixed_costs WHERE transaction_id = ?",
+                (transaction_id,),
+            ).fetchall()
+            rs_rows = self.sqlite.execute(
+                "SELECT * FROM recurring_services WHERE transaction_id = ?",
+                (transaction_id,),
+            ).fetchall()
+            return (
+                [FixedCost(**dict(row)) for row in fc_rows],
+                [RecurringService(**dict(row)) for row in rs_rows],
+            )
+
+        return self._execute_with_fallback(
+            supabase_op=_supabase,
+            sqlite_op=_sqlite,
+            default_factory=lambda: ([], []),
+            operation_name="get_relationships (transactions)",
+        )
+
     def get_paginated(
         self,
         page: int = 1,
@@ -191,21 +264,100 @@ class TransactionRepository(BaseRepository):
             self._queue_pending_sync("insert", transaction.id, data)
             return transaction
 
+    def create_with_details(
+        self,
+        transaction: Transaction,
+        fixed_costs: list[FixedCost],
+        recurring_services: list[RecurringService],
+    ) -> Optional[Transaction]:
+        """Insert a transaction and its detail rows in one Supabase call.
+
+        Calls the ``create_transaction_with_details`` RPC, which writes the
+        header, ``fixed_costs``, and ``recurring_services`` inside a single
+        Postgres transaction — either everything is inserted or nothing.
+        Only the header is cached to SQLite here; the caller mirrors the
+        detail rows through their own repositories.
+
+        Args:
+            transaction: The new transaction header.
+            fixed_costs: Fixed cost rows belonging to *transaction*.
+            recurring_services: Recurring service rows belonging to *transaction*.
+
+        Returns:
+            The created transaction as returned by Supabase, or ``None`` if
+            the RPC is unavailable (offline, connection never established,
+            or the function is not deployed).  On ``None`` nothing was
+            written anywhere and the caller should use :meth:`create` and
+            the per-table ``create_batch`` methods.
+
+        Raises:
+            Exception: Any other RPC failure (constraint, RLS or type
+                errors, or a lost response after the request was sent).
+                Falling back then could duplicate rows that the RPC already
+                committed, so the error is left to the caller.
+        """
+        if not self._db.is_online:
+            return None
+
+        detail_exclude = {"id", "transaction_id"}
+        params: dict[str, object] = {
+            "p_tx": self._serialize_for_supabase(transaction),
+            "p_fixed_costs": [
+                fc.model_dump(mode="json", exclude=detail_exclude)
+                for fc in fixed_costs
+            ],
+            "p_recurring_services": [
+                rs.model_dump(mode="json", exclude=detail_exclude)
+                for rs in recurring_services
+            ],
+        }
+
+        try:
+            response = self.supabase.rpc(
+                self._CREATE_WITH_DETAILS_RPC, params,
+            ).execute()
+        except APIError as exc:
+            if exc.code != self._RPC_NOT_FOUND_CODE:
+                raise
+            self._logger.warning(
+                "Atomic transaction create RPC is not deployed (%s): %s",
+                transaction.id,
+                exc,
+            )
+            return None
+        except self._RPC_NOT_SENT_ERRORS as exc:
+            self._logger.warning(
+                "Atomic transaction create RPC could not connect for %s: %s",
+                transaction.id,
+                exc,
+            )
+            return None
+
+        row = response.data[0] if isinstance(response.data, list) else response.data
+        created = self._parse_transaction(row) if row else transaction
+        self._cache_to_sqlite(created)
+        self._logger.info("Transaction created with details: %s", created.id)
+        return created
+
     def update(self, transaction: Transaction) -> Transaction:
-        """Update an existing transaction. Writes to Supabase and updates SQLite cache."""
+        """Update an existing transaction. Writes to Supabase and updates SQLite cache.
+
+        The row is not echoed back (``returning="minimal"``): *transaction*
+        already holds every written column, so only the matched-row count
+        is requested and the in-memory model is cached and returned.
+        """
         data = self._serialize_for_supabase(transaction)
 
         try:
             response = (
                 self.supabase.table(self.TABLE)
-                .update(data)
+                .update(data, count="exact", returning="minimal")
                 .eq("id", transaction.id)
                 .execute()
             )
-            if response.data:
-                updated = self._parse_transaction(response.data[0])
-                self._cache_to_sqlite(updated)
-                return updated
+            if response.count:
+                self._cache_to_sqlite(transaction)
+                return transaction
         except Exception as exc:
             self._logger.error(
                 "Failed to update transaction in Supabase: %s", exc
@@ -269,6 +421,58 @@ class TransactionRepository(BaseRepository):
 
         return self.get_by_id(transaction_id)
 
+    def update_financial_cache(
+        self,
+        transaction_id: str,
+        financial_cache: dict[str, object],
+        expected_status: ApprovalStatus,
+    ) -> bool:
+        """Write only ``financial_cache``, if the status is still *expected_status*.
+
+        Used by the cache self-heal write-behind, which runs after the
+        detail view returned: touching any other column could overwrite
+        an approval, rejection or edit that landed in between, and the
+        status guard skips rows that changed state since the snapshot.
+        Best-effort -- when Supabase is unreachable only the local cache
+        is healed and nothing is queued; the next cache miss retries.
+
+        Returns:
+            ``True`` if a row was updated.
+        """
+        cache_json: str = _dumps_json(financial_cache)
+        status: str = str(expected_status)
+
+        try:
+            response = (
+                self.supabase.table(self.TABLE)
+                .update(
+                    {"financial_cache": cache_json},
+                    count="exact",
+                    returning="minimal",
+                )
+                .eq("id", transaction_id)
+                .eq("approval_status", status)
+                .execute()
+            )
+            updated: bool = bool(response.count)
+        except Exception as exc:
+            self._logger.warning(
+                "Failed to update financial cache in Supabase for %s: %s",
+                transaction_id,
+                exc,
+            )
+            updated = False
+
+        # Called from a background thread, so serialise with other writers.
+        with self._db.write_lock:
+            cursor = self.sqlite.execute(
+                f"UPDATE {self.TABLE} SET financial_cache = ? "
+                "WHERE id = ? AND approval_status = ?",
+                (cache_json, transaction_id, status),
+            )
+            self._commit()
+        return updated or cursor.rowcount > 0
+
     def soft_delete(self, transaction_id: str) -> bool:
         """Cancel a transaction (soft-delete via status transition).
 
@@ -480,8 +684,8 @@ class TransactionRepository(BaseRepository):
             val = data.get(json_field)
             if isinstance(val, str):
                 try:
-                    data[json_field] = json.loads(val)
-                except (json.JSONDecodeError, ValueError):
+                    data[json_field] = orjson.loads(val)
+                except (orjson.JSONDecodeError, ValueError):
                     data[json_field] = None
         return Transaction(**data)
 
@@ -495,8 +699,8 @@ class TransactionRepository(BaseRepository):
             val = row.get(json_field)
             if isinstance(val, str):
                 try:
-                    row[json_field] = json.loads(val)
-                except (json.JSONDecodeError, ValueError):
+                    row[json_field] = orjson.loads(val)
+                except (orjson.JSONDecodeError, ValueError):
                     row[json_field] = None
         return Transaction(**row)
 
@@ -506,14 +710,9 @@ class TransactionRepository(BaseRepository):
         """Convert a Transaction model to a dict suitable for Supabase insert/update."""
         data = transaction.model_dump(exclude={"fixed_costs", "recurring_services"})
         # Serialize nested models to JSON strings
-        if data.get("master_variables_snapshot") is not None:
-            data["master_variables_snapshot"] = json.dumps(
-                data["master_variables_snapshot"], default=str
-            )
-        if data.get("financial_cache") is not None:
-            data["financial_cache"] = json.dumps(
-                data["financial_cache"], default=str
-            )
+        for json_field in ("master_variables_snapshot", "financial_cache"):
+            if data.get(json_field) is not None:
+                data[json_field] = _dumps_json(data[json_field])
         # Convert datetime objects
         for dt_field in ("submission_date", "approval_date"):
             val = data.get(dt_field)
@@ -581,7 +780,7 @@ class TransactionRepository(BaseRepository):
         # Serialize JSON fields
         for json_field in ("master_variables_snapshot", "financial_cache"):
             if data.get(json_field) is not None:
-                data[json_field] = json.dumps(data[json_field], default=str)
+                data[json_field] = _dumps_json(data[json_field])
         # Convert datetime
         for dt_field in ("submission_date", "approval_date"):
             val = data.get(dt_field)
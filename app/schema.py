@@ -54,7 +54,7 @@ __all__ = ["CURRENT_SCHEMA_VERSION", "initialize_schema"]
 # ---------------------------------------------------------------------------
 # Schema version -- bump this whenever a migration is added.
 # ---------------------------------------------------------------------------
-CURRENT_SCHEMA_VERSION: int = 10
+CURRENT_SCHEMA_VERSION: int = 15
 
 # ---------------------------------------------------------------------------
 # DDL statements for every table in the local database.
@@ -79,7 +79,8 @@ _TABLE_DEFINITIONS: list[str] = [
         status TEXT NOT NULL DEFAULT 'pending',
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
         attempted_at TIMESTAMP,
-        error_message TEXT
+        error_message TEXT,
+        retry_count INTEGER NOT NULL DEFAULT 0
     )
     """,
     # -- persistent structured audit trail ------------------------------------
@@ -215,9 +216,9 @@ _TABLE_DEFINITIONS: list[str] = [
     """
     CREATE TABLE IF NOT EXISTS encrypted_sessions (
         id INTEGER PRIMARY KEY CHECK (id = 1),
-        encrypted_payload BLOB NOT NULL,
-        nonce BLOB NOT NULL,
-        tag BLOB NOT NULL,
+        sealed_payload BLOB NOT NULL,
+        cached_at INTEGER,
+        cipher TEXT NOT NULL DEFAULT 'aes-256-gcm',
         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     )
     """,
@@ -227,7 +228,7 @@ _TABLE_DEFINITIONS: list[str] = [
     "CREATE INDEX IF NOT EXISTS idx_transactions_submission_date ON transactions(submission_date)",
     "CREATE INDEX IF NOT EXISTS idx_fixed_costs_transaction_id ON fixed_costs(transaction_id)",
     "CREATE INDEX IF NOT EXISTS idx_recurring_services_transaction_id ON recurring_services(transaction_id)",
-    "CREATE INDEX IF NOT EXISTS idx_sync_queue_status ON sync_queue(status)",
+    "CREATE INDEX IF NOT EXISTS idx_sync_queue_pending ON sync_queue(created_at) WHERE status = 'pending'",
     # -- indexes for audit and identity lookups (LOCAL ONLY) -----------------
     "CREATE INDEX IF NOT EXISTS idx_audit_log_entity_id ON audit_log(entity_id)",
     "CREATE INDEX IF NOT EXISTS idx_profiles_email ON profiles(email)",
@@ -630,6 +631,155 @@ def _migrate_v9_to_v10(conn: sqlite3.Connection, logger: StructuredLogger) -> No
         logger.info("Migration v9→v10: added created_by column to transactions.")
 
 
+def _migrate_v10_to_v11(conn: sqlite3.Connection, logger: StructuredLogger) -> None:
+    """Collapse ``encrypted_sessions`` nonce/tag/payload into one BLOB.
+
+    The three separate BLOB cells (``encrypted_payload``, ``nonce``,
+    ``tag``) are replaced by a single ``sealed_payload`` cell laid out as
+    ``nonce || ciphertext || tag`` — the envelope ``SessionCacheService``
+    now writes.  Uses the four-step rename dance (create new → copy →
+    drop old → rename).
+
+    Rows are re-packed in Python because SQLite's ``||`` operator
+    coerces BLOBs to TEXT.  Legacy rows whose nonce is not 12 bytes
+    (written by the former PyCryptodome cipher) cannot be represented
+    in the fixed layout and are dropped; the user simply signs in online
+    once to re-cache.
+
+    Does **not** commit — the caller is responsible for transaction
+    management.
+    """
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS encrypted_sessions_new (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            sealed_payload BLOB NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        """
+    )
+
+    legacy_exists: bool = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'encrypted_sessions'"
+    ).fetchone() is not None
+
+    if legacy_exists:
+        rows: list[tuple[int, bytes, bytes, bytes, str]] = conn.execute(
+            "SELECT id, encrypted_payload, nonce, tag, created_at "
+            "FROM encrypted_sessions"
+        ).fetchall()
+        for row_id, payload, nonce, tag, created_at in rows:
+            if len(nonce) != 12:
+                continue
+            conn.execute(
+                "INSERT OR IGNORE INTO encrypted_sessions_new "
+                "(id, sealed_payload, created_at) VALUES (?, ?, ?)",
+                (row_id, bytes(nonce) + bytes(payload) + bytes(tag), created_at),
+            )
+        conn.execute("DROP TABLE encrypted_sessions")
+
+    conn.execute("ALTER TABLE encrypted_sessions_new RENAME TO encrypted_sessions")
+
+    logger.info(
+        "Migration v10→v11: merged encrypted_sessions nonce/tag/payload "
+        "into a single sealed_payload BLOB."
+    )
+
+
+def _migrate_v11_to_v12(conn: sqlite3.Connection, logger: StructuredLogger) -> None:
+    """Add a plaintext ``cached_at`` column to ``encrypted_sessions``.
+
+    Stores the cache timestamp (Unix epoch seconds) outside the
+    ciphertext so ``SessionCacheService`` can reject expired sessions
+    before deriving the key or decrypting.  Nullable so the existing row
+    stays valid; it falls back to the in-payload timestamp.
+
+    Does **not** commit — the caller is responsible for transaction
+    management.
+    """
+    if not _column_exists(conn, "encrypted_sessions", "cached_at"):
+        conn.execute("ALTER TABLE encrypted_sessions ADD COLUMN cached_at INTEGER")
+        logger.info("Migration v11→v12: added cached_at column to encrypted_sessions.")
+
+
+def _migrate_v12_to_v13(conn: sqlite3.Connection, logger: StructuredLogger) -> None:
+    """Add a ``cipher`` identifier column to ``encrypted_sessions``.
+
+    ``SessionCacheService`` now seals payloads with ChaCha20-Poly1305.
+    The column records which AEAD sealed each row so existing rows
+    (defaulted to ``'aes-256-gcm'``) stay decryptable and future
+    algorithm changes are unambiguous.
+
+    Does **not** commit — the caller is responsible for transaction
+    management.
+    """
+    if not _column_exists(conn, "encrypted_sessions", "cipher"):
+        conn.execute(
+            "ALTER TABLE encrypted_sessions "
+            "ADD COLUMN cipher TEXT NOT NULL DEFAULT 'aes-256-gcm'"
+        )
+        logger.info("Migration v12→v13: added cipher column to encrypted_sessions.")
+
+
+def _migrate_v13_to_v14(conn: sqlite3.Connection, logger: StructuredLogger) -> None:
+    """Add an integer ``retry_count`` column to ``sync_queue``.
+
+    ``SyncWorkerService`` previously derived the attempt count by
+    scanning ``error_message`` for ``"Attempt "`` prefixes.  The counter
+    now lives in its own column so a failure is recorded with a single
+    ``UPDATE``.  Existing rows are backfilled from the ``Attempt N:``
+    prefix of their last error message.
+
+    Does **not** commit — the caller is responsible for transaction
+    management.
+    """
+    if not _column_exists(conn, "sync_queue", "retry_count"):
+        conn.execute(
+            "ALTER TABLE sync_queue "
+            "ADD COLUMN retry_count INTEGER NOT NULL DEFAULT 0"
+        )
+        conn.execute(
+            """
+            UPDATE sync_queue
+            SET retry_count = CAST(
+                substr(error_message, 9, instr(error_message, ':') - 9)
+                AS INTEGER
+            )
+            WHERE error_message LIKE 'Attempt %:%'
+            """
+        )
+        logger.info("Migration v13→v14: added retry_count column to sync_queue.")
+
+
+def _migrate_v14_to_v15(conn: sqlite3.Connection, logger: StructuredLogger) -> None:
+    """Add a partial index over pending ``sync_queue`` rows.
+
+    ``SyncWorkerService`` polls ``WHERE status = 'pending' ORDER BY
+    created_at LIMIT ?``.  Indexing only the pending rows by
+    ``created_at`` turns that poll into a short range scan that no
+    longer grows with the synced / permanently-failed history.
+
+    Every ``sync_queue`` status lookup filters on ``'pending'``, so the
+    partial index supersedes ``idx_sync_queue_status``, which is
+    dropped — left in place, the planner prefers it (without
+    ``ANALYZE`` statistics) and sorts the matches in a temp B-tree.
+
+    Uses ``IF [NOT] EXISTS`` for idempotency.
+
+    Does **not** commit — the caller is responsible for transaction
+    management.
+    """
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_sync_queue_pending "
+        "ON sync_queue(created_at) WHERE status = 'pending'"
+    )
+    conn.execute("DROP INDEX IF EXISTS idx_sync_queue_status")
+    logger.info(
+        "Migration v14→v15: replaced idx_sync_queue_status with partial "
+        "index idx_sync_queue_pending."
+    )
+
+
 # ---------------------------------------------------------------------------
 # Migration registry — maps *target* version to its migration function.
 # ---------------------------------------------------------------------------
@@ -643,6 +793,11 @@ _MIGRATIONS: dict[int, MigrationFunc] = {
     8: _migrate_v7_to_v8,
     9: _migrate_v8_to_v9,
     10: _migrate_v9_to_v10,
+    11: _migrate_v10_to_v11,
+    12: _migrate_v11_to_v12,
+    13: _migrate_v12_to_v13,
+    14: _migrate_v13_to_v14,
+    15: _migrate_v14_to_v15,
 }
 
 
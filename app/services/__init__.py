@@ -24,6 +24,7 @@ from app.repositories.recurring_service_repository import RecurringServiceReposi
 from app.repositories.transaction_repository import TransactionRepository
 from app.repositories.user_repository import UserRepository
 from app.services.app_settings_service import AppSettingsService
+from app.services.audit_writer import AuditWriterService
 from app.services.auth_service import AuthService
 from app.services.email_service import EmailService
 from app.services.excel_parser import ExcelParserService
@@ -65,6 +66,7 @@ class ServiceContainer(TypedDict, total=False):
 
     # --- Infrastructure ---
     app_settings_service: AppSettingsService
+    audit_writer_service: AuditWriterService
 
     # --- Phase 2: Observer & Native Interaction ---
     path_discovery_service: PathDiscoveryService
@@ -140,6 +142,10 @@ def create_services(
     transaction_preview_service = TransactionPreviewService(
         logger=logger,
     )
+    audit_writer_service = AuditWriterService(
+        db=db,
+        logger=logger,
+    )
 
     auth_service = AuthService(
         db=db,
@@ -159,6 +165,7 @@ def create_services(
         recurring_service_repo=recurring_service_repo,
         email_service=email_service,
         variable_service=variable_service,
+        audit_writer=audit_writer_service,
         logger=logger,
     )
 
@@ -207,6 +214,7 @@ def create_services(
         email_service=email_service,
         crud_service=transaction_crud_service,
         file_archival=file_archival_service,
+        audit_writer=audit_writer_service,
         logger=logger,
     )
 
@@ -252,6 +260,7 @@ def create_services(
         transaction_workflow_service=transaction_workflow_service,
         transaction_preview_service=transaction_preview_service,
         app_settings_service=app_settings_service,
+        audit_writer_service=audit_writer_service,
         path_discovery_service=path_discovery_service,
         file_guards_service=file_guards_service,
         native_opener_service=native_opener_service,
@@ -0,0 +1,216 @@
+"""
+Audit Writer Service.
+
+Background daemon thread that persists audit events to the SQLite
+``audit_log`` table in batches.  Follows the same daemon-thread
+lifecycle as :class:`SyncWorkerService`: the caller invokes
+:meth:`start` / :meth:`stop`, and :meth:`enqueue` hands events to the
+worker instead of committing them on the caller's thread.
+
+The structured ``AUDIT:`` log line is still emitted synchronously by
+:meth:`enqueue`, so the event is on record even if the process dies
+before the next flush; only the queryable SQLite copy is deferred.
+
+Thread Safety
+-------------
+Flushes acquire ``DatabaseManager.write_lock`` before writing, and
+:meth:`stop` drains the queue before returning so no accepted event is
+dropped on a clean shutdown.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Optional
+
+from app.database import DatabaseManager
+from app.logger import StructuredLogger
+from app.services.base_service import BaseService
+from app.utils.audit import AuditEvent, DetailValue, persist_audit_events
+
+
+class AuditWriterService(BaseService):
+    """Daemon thread that batches audit events into SQLite.
+
+    Parameters
+    ----------
+    db:
+        Initialised ``DatabaseManager`` providing ``.sqlite`` and
+        ``.write_lock`` access.
+    logger:
+        Structured JSON logger; also receives the ``AUDIT:`` lines.
+    """
+
+    # ------------------------------------------------------------------
+    # Class constants
+    # ------------------------------------------------------------------
+
+    _MAX_BATCH: int = 100
+    _FLUSH_INTERVAL_S: float = 1.0  # Linger after the first event of a batch.
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def __init__(
+        self,
+        db: DatabaseManager,
+        logger: StructuredLogger,
+    ) -> None:
+        super().__init__(logger)
+        self._db: DatabaseManager = db
+        self._queue: queue.SimpleQueue[Optional[AuditEvent]] = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
+
+    def start(self) -> None:
+        """Start the audit writer on a daemon thread.
+
+        Idempotent — calling ``start()`` when the writer is already
+        running is a no-op.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._thread = threading.Thread(
+            target=self._run_loop,
+            name="AuditWriter",
+            daemon=True,
+        )
+        self._thread.start()
+        self._logger.info("Audit writer started.")
+
+    def stop(self) -> None:
+        """Flush pending events and wait up to 10 s for the thread to exit.
+
+        Safe to call when the writer is not running.
+        """
+        if self._thread is None:
+            return
+
+        self._queue.put(None)  # Sentinel: flush and exit.
+        self._thread.join(timeout=10.0)
+
+        if self._thread.is_alive():
+            self._logger.warning(
+                "Audit writer thread did not terminate within 10 s."
+            )
+        else:
+            self._logger.info("Audit writer stopped.")
+        self._thread = None
+
+        # Events enqueued after the sentinel (or left by a hung thread).
+        self._write(self._drain())
+
+    @property
+    def is_running(self) -> bool:
+        """``True`` when the writer thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def enqueue(
+        self,
+        action: str,
+        entity_type: str,
+        entity_id: str,
+        user_id: str,
+        details: Optional[dict[str, DetailValue]] = None,
+    ) -> None:
+        """Record an audit event without waiting for the SQLite write.
+
+        Validates and logs the event immediately, then queues it for the
+        next batch.  When the writer is not running the event is
+        persisted synchronously instead, so nothing is lost.
+
+        Parameters
+        ----------
+        action:
+            What happened (e.g. ``"CREATE"``, ``"APPROVE"``).
+        entity_type:
+            Type of entity affected (e.g. ``"Transaction"``).
+        entity_id:
+            Primary key of the affected entity.
+        user_id:
+            ID of the user who performed the action.
+        details:
+            Optional additional context (e.g. old/new values).
+        """
+        event = AuditEvent(
+            timestamp=datetime.now(timezone.utc).isoformat(),
+            action=action,
+            entity_type=entity_type,
+            entity_id=entity_id,
+            user_id=user_id,
+            details=details or {},
+        )
+        self._logger.info("AUDIT: %s", json.dumps(event.model_dump(), default=str))
+
+        if self.is_running:
+            self._queue.put(event)
+        else:
+            self._write([event])
+
+    # ------------------------------------------------------------------
+    # Core loop
+    # ------------------------------------------------------------------
+
+    def _run_loop(self) -> None:
+        """Main loop executed on the daemon thread.
+
+        Blocks until an event arrives, then keeps collecting for up to
+        ``_FLUSH_INTERVAL_S`` or ``_MAX_BATCH`` events and writes the
+        batch with one ``executemany`` and one commit.
+        """
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+
+            batch: list[AuditEvent] = [first]
+            deadline = time.monotonic() + self._FLUSH_INTERVAL_S
+            while len(batch) < self._MAX_BATCH:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    event = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+
+            self._write(batch)
+
+    def _drain(self) -> list[AuditEvent]:
+        """Return every event currently queued, skipping sentinels."""
+        events: list[AuditEvent] = []
+        while True:
+            try:
+                event = self._queue.get_nowait()
+            except queue.Empty:
+                return events
+            if event is not None:
+                events.append(event)
+
+    def _write(self, events: list[AuditEvent]) -> None:
+        """Persist *events*; failures are logged, never propagated."""
+        if not events:
+            return
+        try:
+            with self._db.write_lock:
+                persist_audit_events(self._db.sqlite, events)
+        except Exception as db_err:
+            self._logger.warning(
+                "Failed to persist %d audit event(s) to SQLite: %s",
+                len(events),
+                db_err,
+            )
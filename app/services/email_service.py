@@ -2,20 +2,24 @@
 Email Notification Service.
 
 Handles all outbound email notifications for the FinanceGatekeeper application.
-Sends synchronously via SMTP with structured audit logging for every attempt.
+Sends via SMTP with structured audit logging for every attempt, either
+synchronously (``send_*``) or on the service's own background pool
+(``submit_*``) so SMTP latency never blocks a save, approval or rejection.
 
 Architectural notes:
     - Configuration sourced from AppConfig singleton (no Flask dependency).
     - User lookups delegated to injected UserRepository (offline-first).
     - All print() diagnostics replaced with structured logger calls.
     - Email config validated lazily on first send (instance-level flag).
+    - One process-wide send pool, shut down by the composition root.
 """
 
 from __future__ import annotations
 
 import smtplib
+from concurrent.futures import Future, ThreadPoolExecutor
 from email.message import EmailMessage
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 from app.config import AppConfig
 from app.logger import StructuredLogger
@@ -29,6 +33,9 @@ from app.utils.audit import log_audit_event
 class EmailService(BaseService):
     """Service for composing and sending email notifications."""
 
+    # Threads sending notification emails off the save/approve/reject path.
+    _SEND_WORKERS: int = 4
+
     def __init__(
         self,
         user_repo: UserRepository,
@@ -39,6 +46,10 @@ class EmailService(BaseService):
         self._user_repo = user_repo
         self._config: AppConfig = config
         self._validated: bool = False
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=self._SEND_WORKERS,
+            thread_name_prefix="EmailNotify",
+        )
 
     # ------------------------------------------------------------------
     # Core send method
@@ -188,10 +199,61 @@ class EmailService(BaseService):
 
         return self.send_email(recipient_email, subject, body)
 
+    # ------------------------------------------------------------------
+    # Background sending
+    # ------------------------------------------------------------------
+
+    def submit_new_transaction(
+        self,
+        salesman_name: str,
+        client_name: str,
+        salesman_email: str,
+    ) -> Future[ServiceResult]:
+        """Queue :meth:`send_new_transaction_email` on the send pool."""
+        return self._submit(
+            self.send_new_transaction_email,
+            salesman_name=salesman_name,
+            client_name=client_name,
+            salesman_email=salesman_email,
+        )
+
+    def submit_status_update(
+        self,
+        transaction: Transaction,
+        new_status: str,
+    ) -> Future[ServiceResult]:
+        """Queue :meth:`send_status_update_email` on the send pool."""
+        return self._submit(self.send_status_update_email, transaction, new_status)
+
+    def shutdown(self) -> None:
+        """Wait for queued sends to finish and stop the send pool.
+
+        Called once by the composition root before the database closes
+        (status emails look up the salesman through ``UserRepository``).
+        """
+        self._executor.shutdown(wait=True)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
 
+    def _submit(
+        self,
+        send: Callable[..., ServiceResult],
+        *args: object,
+        **kwargs: object,
+    ) -> Future[ServiceResult]:
+        """Run *send* on the pool; an exception it raises is only logged."""
+        future: Future[ServiceResult] = self._executor.submit(send, *args, **kwargs)
+        future.add_done_callback(self._log_send_failure)
+        return future
+
+    def _log_send_failure(self, future: Future[ServiceResult]) -> None:
+        """Done-callback: log an exception raised by a background send."""
+        exc = future.exception()
+        if exc is not None:
+            self._logger.error("Background email notification failed: %s", exc)
+
     def _dispatch_smtp(
         self,
         config: AppConfig,
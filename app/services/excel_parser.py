@@ -27,7 +27,6 @@ Defensive File Handling:
 from __future__ import annotations
 
 import hashlib
-import traceback
 from datetime import datetime, timezone
 from decimal import Decimal
 from pathlib import Path
@@ -271,9 +270,9 @@ class ExcelParserService(BaseService):
 
         except PermissionError as perm_err:
             self._logger.error(
-                "PermissionError during Excel processing: %s\n%s",
+                "PermissionError during Excel processing: %s",
                 perm_err,
-                traceback.format_exc(),
+                exc_info=True,
             )
             return ServiceResult(
                 success=False,
@@ -287,9 +286,9 @@ class ExcelParserService(BaseService):
 
         except Exception as exc:
             self._logger.error(
-                "Unexpected error during Excel processing: %s\n%s",
+                "Unexpected error during Excel processing: %s",
                 exc,
-                traceback.format_exc(),
+                exc_info=True,
             )
             return ServiceResult(
                 success=False,
@@ -389,10 +388,10 @@ class ExcelParserService(BaseService):
 
         except Exception as exc:
             self._logger.error(
-                "Metadata extraction failed for %s: %s\n%s",
+                "Metadata extraction failed for %s: %s",
                 file_path.name,
                 exc,
-                traceback.format_exc(),
+                exc_info=True,
             )
             return ServiceResult(
                 success=False,
@@ -444,10 +443,10 @@ class ExcelParserService(BaseService):
 
         except Exception as exc:
             self._logger.error(
-                "process_local_file failed for %s: %s\n%s",
+                "process_local_file failed for %s: %s",
                 file_path.name,
                 exc,
-                traceback.format_exc(),
+                exc_info=True,
             )
             return ServiceResult(
                 success=False,
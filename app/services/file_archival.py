@@ -24,6 +24,7 @@ development environments only).
 from __future__ import annotations
 
 import base64
+import hashlib
 import shutil
 import sys
 from datetime import datetime
@@ -227,8 +228,16 @@ class FileArchivalService(BaseService):
             )
 
         # --- Step 2: Chain-of-custody hash verification ---
+        # Encryption needs the whole plaintext in memory anyway, so read it
+        # once and hash those bytes: the ciphertext is then built from
+        # exactly the content that was verified, with no second read.
+        plaintext: bytes | None = None
         try:
-            current_sha256: str = self._file_guards.compute_sha256(source_path)
+            if encrypt:
+                plaintext = source_path.read_bytes()
+                current_sha256: str = hashlib.sha256(plaintext).hexdigest()
+            else:
+                current_sha256 = self._file_guards.compute_sha256(source_path)
         except FileNotFoundError:
             return ServiceResult(
                 success=False,
@@ -289,9 +298,9 @@ class FileArchivalService(BaseService):
 
         # --- Step 5: Optional encryption ---
         file_to_move: Path = source_path
-        if encrypt:
+        if plaintext is not None:
             try:
-                file_to_move = self._encrypt_file(source_path)
+                file_to_move = self._encrypt_file(source_path, plaintext)
                 # Update filename to include the .enc extension
                 new_filename = f"{transaction_id}_{original_name}.enc"
             except Exception as exc:
@@ -515,16 +524,19 @@ class FileArchivalService(BaseService):
         self._logger.info("New archive encryption key generated and stored.")
         return key
 
-    def _encrypt_file(self, source_path: Path) -> Path:
+    def _encrypt_file(self, source_path: Path, data: bytes) -> Path:
         """Encrypt file contents using Fernet symmetric encryption.
 
-        Reads the source file, encrypts its contents, writes the ciphertext
-        to ``{source_path}.enc``, and deletes the original plaintext file.
+        Encrypts *data* (the already-read contents of *source_path*),
+        writes the ciphertext to ``{source_path}.enc``, and deletes the
+        original plaintext file.
 
         Parameters
         ----------
         source_path:
             Path to the plaintext file to encrypt.
+        data:
+            Contents of ``source_path``, as read for hash verification.
 
         Returns
         -------
@@ -545,7 +557,6 @@ class FileArchivalService(BaseService):
         key: bytes = self._get_or_create_fernet_key()
         fernet = Fernet(key)
 
-        data: bytes = source_path.read_bytes()
         encrypted_data: bytes = fernet.encrypt(data)
 
         encrypted_path: Path = source_path.with_suffix(source_path.suffix + ".enc")
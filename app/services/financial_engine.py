@@ -9,7 +9,8 @@ components.  This module is a pure logic library with **no** imports from
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Optional, Union
+from functools import lru_cache
+from typing import Iterable, Mapping, Optional, Union
 
 from app.models.enums import Currency
 from app.models.service_models import (
@@ -48,6 +49,8 @@ _TimelineValue = Union[
 ]
 TimelineDict = dict[str, _TimelineValue]
 
+_ZERO: Decimal = Decimal("0")
+
 
 # --- 1. CurrencyConverter ---
 
@@ -58,6 +61,15 @@ class CurrencyConverter:
 
     def __init__(self, tipo_cambio: Decimal = Decimal("1")) -> None:
         self.tipo_cambio: Decimal = tipo_cambio or Decimal("1")
+        self._is_identity: bool = self.tipo_cambio == 1
+
+    @property
+    def is_identity(self) -> bool:
+        """``True`` when the rate is 1, so conversion never changes a value.
+
+        This is the default when a payload has no ``tipo_cambio``.
+        """
+        return self._is_identity
 
     def to_pen(self, value: Decimal, currency: Union[Currency, str]) -> Decimal:
         """Convert a monetary value to PEN using the stored exchange rate.
@@ -67,12 +79,40 @@ class CurrencyConverter:
             currency: The source currency (PEN or USD).
 
         Returns:
-            The equivalent value in PEN.
+            The equivalent value in PEN.  PEN amounts and identity rates
+            are returned as-is, without a Decimal multiplication.
         """
-        value = value or Decimal("0")
-        if currency == Currency.USD:
-            return value * self.tipo_cambio
-        return value
+        if not value:
+            return _ZERO
+        if self._is_identity or currency != Currency.USD:
+            return value
+        return value * self.tipo_cambio
+
+    def to_pen_many(
+        self,
+        pairs: Iterable[tuple[Decimal, Union[Currency, str]]],
+    ) -> list[Decimal]:
+        """Convert several ``(value, currency)`` pairs to PEN in one call.
+
+        Same rules as :meth:`to_pen`, applied in a single loop with the
+        exchange rate held in a local.  With an identity rate the values
+        are passed through without any Decimal multiplication.
+
+        Args:
+            pairs: ``(value, currency)`` tuples to convert.
+
+        Returns:
+            The PEN equivalents, in input order.
+        """
+        rate: Decimal = self.tipo_cambio
+        zero: Decimal = _ZERO
+        if self._is_identity:
+            return [value or zero for value, _ in pairs]
+        usd: Currency = Currency.USD
+        return [
+            (value or zero) * rate if currency == usd else (value or zero)
+            for value, currency in pairs
+        ]
 
 
 # --- 2. RecurringServiceProcessor ---
@@ -275,6 +315,16 @@ def _prepare_and_calculate_commission(
 
 # --- 7. TimelineGenerator ---
 
+@lru_cache(maxsize=16)
+def _period_labels(num_periods: int) -> tuple[str, ...]:
+    """Return the ``t=0 .. t=n-1`` column labels for *num_periods* months.
+
+    Contract terms repeat (36 months is the default), so the formatted
+    labels are built once per term and copied into each timeline.
+    """
+    return tuple(f"t={i}" for i in range(num_periods))
+
+
 def initialize_timeline(num_periods: int) -> TimelineDict:
     """Create a dictionary to hold the detailed timeline components.
 
@@ -285,18 +335,21 @@ def initialize_timeline(num_periods: int) -> TimelineDict:
         A nested dict skeleton with zeroed revenue, expense, and net cash
         flow arrays.
     """
+    # The timeline is mutated by build_timeline(), so every call gets
+    # fresh lists; only the immutable labels and zero are shared.
+    zero: Decimal = Decimal("0")
     return {
-        'periods': [f"t={i}" for i in range(num_periods)],
+        'periods': list(_period_labels(num_periods)),
         'revenues': {
-            'nrc': [Decimal("0")] * num_periods,
-            'mrc': [Decimal("0")] * num_periods,
+            'nrc': [zero] * num_periods,
+            'mrc': [zero] * num_periods,
         },
         'expenses': {
-            'comisiones': [Decimal("0")] * num_periods,
-            'egreso': [Decimal("0")] * num_periods,
+            'comisiones': [zero] * num_periods,
+            'egreso': [zero] * num_periods,
             'fixed_costs': [],
         },
-        'net_cash_flow': [Decimal("0")] * num_periods,
+        'net_cash_flow': [zero] * num_periods,
     }
 
 
@@ -428,7 +481,7 @@ def calculate_kpis(
 # --- 9. Main Orchestrator ---
 
 def calculate_financial_metrics(
-    data: Union[FinancialEngineInput, dict[str, object]],
+    data: Union[FinancialEngineInput, Mapping[str, object]],
 ) -> FinancialMetricsResult:
     """Orchestrate all modular financial engine components.
 
@@ -436,12 +489,13 @@ def calculate_financial_metrics(
     currency conversion, service processing, cost resolution, commission
     computation, timeline generation, and KPI derivation.
 
-    Accepts either a validated ``FinancialEngineInput`` model or a raw dict.
-    When a dict is passed it is validated into the model automatically,
+    Accepts either a validated ``FinancialEngineInput`` model or a raw
+    mapping (a dict, or e.g. a ``ChainMap`` layering overrides on a
+    payload).  A mapping is validated into the model automatically,
     preserving backward compatibility with callers that build dicts.
 
     Args:
-        data: ``FinancialEngineInput`` model (preferred) or a dict with keys:
+        data: ``FinancialEngineInput`` model (preferred) or a mapping with keys:
             - tipo_cambio: Exchange rate (USD to PEN)
             - plazo_contrato: Contract term in months
             - recurring_services: List of recurring service items
@@ -459,11 +513,11 @@ def calculate_financial_metrics(
     # internals.  Sub-functions return new model instances (no in-place
     # mutation), but the copy still prevents accidental coupling if the
     # caller later inspects or re-uses the original FinancialEngineInput.
-    if isinstance(data, dict):
-        # Validate raw dict into the model (deep copy is implicit in model creation)
-        engine_input: FinancialEngineInput = FinancialEngineInput.model_validate(data)
+    if isinstance(data, FinancialEngineInput):
+        engine_input: FinancialEngineInput = data.model_copy(deep=True)
     else:
-        engine_input = data.model_copy(deep=True)
+        # Validate raw mapping into the model (deep copy is implicit in model creation)
+        engine_input = FinancialEngineInput.model_validate(data)
 
     # --- Guard clauses: reject nonsensical inputs early (M3) ---
     if engine_input.plazo_contrato < 0:
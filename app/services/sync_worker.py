@@ -6,6 +6,8 @@ Supabase.  Follows the same daemon-thread lifecycle pattern as
 :class:`FileWatcherService`: the caller invokes :meth:`start` /
 :meth:`stop`, and the worker thread polls the local SQLite queue at a
 configurable interval with exponential backoff on consecutive failures.
+Enqueuers also signal ``DatabaseManager.sync_work_available`` so that a
+healthy worker replays new rows immediately instead of on the next tick.
 
 The ``sync_queue`` table acts as a write-ahead log: every local mutation
 is enqueued there first, and this service replays those mutations to
@@ -17,13 +19,20 @@ Thread Safety
 All SQLite writes acquire ``DatabaseManager.write_lock`` (an
 ``RLock``) before executing, ensuring serialised access from the
 main thread, the sync worker, and any other background services.
+The pending-row poll runs on the worker's own read-only connection
+(see :meth:`DatabaseManager.open_reader`) and takes no lock.
 """
 
 from __future__ import annotations
 
-import json
+import logging
+import random
+import sqlite3
 import threading
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Final, Optional
+
+import orjson
 
 from app.config import AppConfig
 from app.database import DatabaseManager
@@ -31,6 +40,55 @@ from app.logger import StructuredLogger
 from app.services.base_service import BaseService
 
 
+# A polled ``sync_queue`` row, in ``_SQL_SELECT_PENDING`` column order:
+# (id, table_name, operation, entity_id, payload).
+_QueueRow = tuple[int, str, str, str, str]
+
+# Result of replaying some rows: (synced queue ids, [(queue_id, error)]).
+_ReplayOutcome = tuple[list[int], list[tuple[int, str]]]
+
+
+# ---------------------------------------------------------------------------
+# SQL statements
+# ---------------------------------------------------------------------------
+# Fixed statement text, so each one is prepared once in the connection's
+# statement cache and reused by every cycle (and every executemany row).
+
+_SQL_QUARANTINE_MALFORMED: Final[str] = """
+    UPDATE sync_queue
+    SET status = 'permanently_failed',
+        attempted_at = CURRENT_TIMESTAMP,
+        error_message = 'Malformed JSON payload'
+    WHERE status = 'pending' AND NOT json_valid(payload)
+"""
+
+_SQL_SELECT_PENDING: Final[str] = """
+    SELECT id, table_name, operation, entity_id, payload
+    FROM sync_queue
+    WHERE status = 'pending' AND json_valid(payload)
+    ORDER BY created_at ASC
+    LIMIT ?
+"""
+
+_SQL_MARK_SYNCED: Final[str] = """
+    UPDATE sync_queue
+    SET status = 'synced', attempted_at = CURRENT_TIMESTAMP
+    WHERE id = ?
+"""
+
+_SQL_MARK_FAILED: Final[str] = """
+    UPDATE sync_queue
+    SET retry_count = retry_count + 1,
+        status = CASE
+            WHEN retry_count + 1 >= ? THEN 'permanently_failed'
+            ELSE 'pending'
+        END,
+        attempted_at = CURRENT_TIMESTAMP,
+        error_message = 'Attempt ' || (retry_count + 1) || ': ' || ?
+    WHERE id = ?
+"""
+
+
 class SyncWorkerService(BaseService):
     """Daemon thread that drains the local ``sync_queue`` to Supabase.
 
@@ -53,6 +111,19 @@ class SyncWorkerService(BaseService):
     _MAX_INTERVAL_S: float = 300.0  # 5-minute cap
     _BATCH_SIZE: int = 50
     _MAX_RETRY_COUNT: int = 5
+    _MAX_REPLAY_WORKERS: int = 16
+
+    # Operations whose rows can be sent to PostgREST as one JSON array.
+    _COALESCED_OPERATIONS: frozenset[str] = frozenset({"insert", "upsert"})
+
+    # Operations whose queued JSON is forwarded to PostgREST verbatim,
+    # mapped to (HTTP method, Prefer header, filter on ``id``).
+    _RAW_REQUESTS: dict[str, tuple[str, str, bool]] = {
+        "insert": ("POST", "return=minimal", False),
+        "upsert": ("POST", "return=minimal,resolution=merge-duplicates", False),
+        "update": ("PATCH", "return=minimal", True),
+        "update_status": ("PATCH", "return=minimal", True),
+    }
 
     _ALLOWED_TABLES: frozenset[str] = frozenset({
         "transactions",
@@ -77,8 +148,14 @@ class SyncWorkerService(BaseService):
         self._db: DatabaseManager = db
         self._config: AppConfig = config
         self._thread: Optional[threading.Thread] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
         self._stop_event: threading.Event = threading.Event()
         self._consecutive_failures: int = 0
+        self._last_cycle_had_failures: bool = False
+        self._queue_drained: bool = False
+        self._reader: Optional[sqlite3.Connection] = None
+        self._rng: random.Random = random.Random()
+        self._table_urls: dict[str, str] = self._bind_table_urls()
 
     # ------------------------------------------------------------------
     # Public API
@@ -96,7 +173,13 @@ class SyncWorkerService(BaseService):
 
         self._stop_event.clear()
         self._consecutive_failures = 0
+        self._last_cycle_had_failures = False
+        self._queue_drained = False
 
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._MAX_REPLAY_WORKERS,
+            thread_name_prefix="SyncReplay",
+        )
         self._thread = threading.Thread(
             target=self._run_loop,
             name="SyncWorker",
@@ -114,6 +197,7 @@ class SyncWorkerService(BaseService):
             return
 
         self._stop_event.set()
+        self._db.sync_work_available.set()  # Wake the loop if it is idle.
         self._thread.join(timeout=10.0)
 
         if self._thread.is_alive():
@@ -124,6 +208,9 @@ class SyncWorkerService(BaseService):
             self._logger.info("Sync worker stopped.")
 
         self._thread = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     @property
     def is_running(self) -> bool:
@@ -137,23 +224,48 @@ class SyncWorkerService(BaseService):
     def _run_loop(self) -> None:
         """Main loop executed on the daemon thread.
 
+        While the last cycle was clean the loop also wakes as soon as a
+        repository enqueues a row.  After any failure it only waits on
+        the backoff interval: rows are enqueued precisely when Supabase
+        writes fail, so waking on every enqueue during an outage would
+        burn through the retry budget of the pending rows.
+
+        Once a cycle has emptied the queue, timer wake-ups are skipped
+        without touching SQLite: every enqueue sets the wake event, so
+        nothing can be pending until that happens.
+
+        The read-only poll connection is opened here and closed on
+        exit, so it is only ever used by the worker thread.
+
         Wrapped in a top-level ``try/except`` so that an unexpected
         exception logs an error rather than silently killing the thread.
         """
+        work_available = self._db.sync_work_available
+        self._reader = self._open_reader()
         try:
             while not self._stop_event.is_set():
                 interval = self._calculate_backoff_interval()
-                if self._stop_event.wait(timeout=interval):
+                woken = False
+                if self._consecutive_failures == 0 and not self._last_cycle_had_failures:
+                    woken = work_available.wait(timeout=interval)
+                else:
+                    self._stop_event.wait(timeout=interval)
+                work_available.clear()
+                if self._stop_event.is_set():
                     break  # Stop requested
 
                 if not self._db.is_online:
                     continue
 
+                if self._queue_drained and not woken:
+                    continue  # Nothing enqueued since the queue emptied.
+
                 try:
                     synced = self._process_pending_queue()
                     if synced > 0:
                         self._consecutive_failures = 0
                 except Exception:
+                    self._queue_drained = False
                     self._consecutive_failures += 1
                     self._logger.warning(
                         "Sync cycle failed", exc_info=True,
@@ -163,6 +275,26 @@ class SyncWorkerService(BaseService):
                 "Sync worker thread terminated due to unhandled exception.",
                 exc_info=True,
             )
+        finally:
+            if self._reader is not None:
+                self._reader.close()
+                self._reader = None
+
+    def _open_reader(self) -> Optional[sqlite3.Connection]:
+        """Open the worker's read-only poll connection.
+
+        Returns ``None`` (poll on the shared connection under the write
+        lock instead) if the database file cannot be opened read-only.
+        """
+        try:
+            return self._db.open_reader()
+        except sqlite3.Error:
+            self._logger.warning(
+                "Read-only sync connection unavailable; polling on the "
+                "shared connection.",
+                exc_info=True,
+            )
+            return None
 
     # ------------------------------------------------------------------
     # Queue processing
@@ -171,69 +303,244 @@ class SyncWorkerService(BaseService):
     def _process_pending_queue(self) -> int:
         """Read pending rows, replay to Supabase, mark synced/failed.
 
+        Rows are grouped by ``entity_id`` so that every mutation of the
+        same entity (e.g. a transaction insert followed by its
+        ``replace`` of fixed costs) is replayed in queue order, while
+        independent entities are replayed concurrently on a small
+        thread pool.  The replay is I/O-bound, so the pool overlaps the
+        HTTPS round-trips instead of paying one RTT per row.
+
+        An ``insert`` / ``upsert`` that opens its entity's chain has
+        nothing queued ahead of it, so those rows are first coalesced
+        per ``(table_name, operation)`` and sent as a single JSON-array
+        request; the rest of each chain is replayed afterwards.
+
+        Payload validity is checked by SQLite's ``json_valid()``: rows
+        that can never replay are moved to ``permanently_failed`` before
+        the poll, and the poll only returns well-formed payloads.  The
+        poll itself reads the committed WAL snapshot on the worker's
+        read-only connection, so it never waits on the write lock.
+
         Returns
         -------
         int
             Number of rows successfully synced in this cycle.
         """
         with self._db.write_lock:
-            rows = self._db.sqlite.execute(
-                """
-                SELECT id, table_name, operation, entity_id, payload
-                FROM sync_queue
-                WHERE status = 'pending'
-                ORDER BY created_at ASC
-                LIMIT ?
-                """,
-                (self._BATCH_SIZE,),
+            quarantined = self._db.sqlite.execute(
+                _SQL_QUARANTINE_MALFORMED,
+            ).rowcount
+            self._db.sqlite.commit()
+
+        rows: list[_QueueRow]
+        if self._reader is not None:
+            rows = self._reader.execute(
+                _SQL_SELECT_PENDING, (self._BATCH_SIZE,),
             ).fetchall()
+        else:
+            with self._db.write_lock:
+                cursor = self._db.sqlite.cursor()
+                cursor.row_factory = None  # Plain tuples, unpacked positionally.
+                rows = cursor.execute(
+                    _SQL_SELECT_PENDING, (self._BATCH_SIZE,),
+                ).fetchall()
+
+        if quarantined > 0:
+            self._logger.error(
+                "Marked %d sync_queue row(s) with malformed JSON as "
+                "permanently failed.",
+                quarantined,
+            )
 
         if not rows:
+            self._queue_drained = True
             return 0
 
-        synced_count: int = 0
-
+        chains: dict[str, list[_QueueRow]] = {}
         for row in rows:
-            queue_id: int = row["id"]
-            table_name: str = row["table_name"]
-            operation: str = row["operation"]
-            entity_id: str = row["entity_id"]
-            raw_payload: str = row["payload"]
-
-            try:
-                payload: dict[str, object] | list[dict[str, object]] = json.loads(raw_payload)
-            except (json.JSONDecodeError, TypeError) as exc:
-                self._logger.error(
-                    "Malformed JSON payload in sync_queue row %d: %s",
-                    queue_id,
-                    exc,
+            chains.setdefault(row[3], []).append(row)
+
+        groups: dict[tuple[str, str], list[tuple[int, str, str]]] = {}
+        independent: list[list[_QueueRow]] = []
+        after_groups: list[list[_QueueRow]] = []
+        for chain in chains.values():
+            queue_id, table_name, operation, entity_id, raw_payload = chain[0]
+            if (
+                operation in self._COALESCED_OPERATIONS
+                and table_name in self._table_urls
+                and isinstance(raw_payload, str)
+                and raw_payload.lstrip().startswith("{")
+            ):
+                groups.setdefault((table_name, operation), []).append(
+                    (queue_id, entity_id, raw_payload),
                 )
-                self._mark_failed(queue_id, f"Malformed JSON: {exc}")
-                continue
+                del chain[0]
+                if chain:
+                    after_groups.append(chain)
+            else:
+                independent.append(chain)
+
+        synced_ids: list[int] = []
+        failed: list[tuple[int, str]] = []
+
+        # Submit everything that can run now, then collect completions.
+        # Only chains whose head went out in a coalesced request wait
+        # for the batched requests to finish.
+        executor = self._executor
+        if executor is None:
+            raise RuntimeError("Sync worker replay pool is not running.")
+
+        batches: list[Future[_ReplayOutcome]] = [
+            executor.submit(self._replay_group, group) for group in groups.items()
+        ]
+        replays: list[Future[_ReplayOutcome]] = [
+            executor.submit(self._replay_chain, chain) for chain in independent
+        ]
+
+        for future in batches:
+            done_synced, done_failed = future.result()
+            synced_ids.extend(done_synced)
+            failed.extend(done_failed)
+
+        replays += [executor.submit(self._replay_chain, chain) for chain in after_groups]
+        for future in replays:
+            done_synced, done_failed = future.result()
+            synced_ids.extend(done_synced)
+            failed.extend(done_failed)
+
+        self._mark_outcomes(synced_ids, failed)
+        self._last_cycle_had_failures = bool(failed)
+        self._queue_drained = not failed and len(rows) < self._BATCH_SIZE
+
+        synced_count = len(synced_ids)
+        if synced_count > 0:
+            self._logger.info(
+                "Sync cycle complete: %d/%d rows synced.", synced_count, len(rows),
+            )
+
+        return synced_count
+
+    def _replay_group(
+        self,
+        group: tuple[tuple[str, str], list[tuple[int, str, str]]],
+    ) -> _ReplayOutcome:
+        """Replay coalesced ``insert`` / ``upsert`` rows in few requests.
+
+        PostgREST takes the column list of a bulk insert from its first
+        object, so keys present only in later rows would be dropped and
+        keys missing from them written as ``NULL`` instead of the column
+        default.  Rows are therefore batched only with rows that have
+        the same key set, and each batch names those keys in the
+        ``columns`` query parameter the way postgrest-py does.
+
+        If a batched request fails, each of its rows is replayed on its
+        own so that a single bad payload does not fail the whole batch.
 
+        Parameters
+        ----------
+        group:
+            ``((table_name, operation), items)`` where each item is a
+            ``(queue_id, entity_id, raw_payload)`` triple in queue order
+            and every ``raw_payload`` is a JSON object.
+
+        Returns
+        -------
+        tuple[list[int], list[tuple[int, str]]]
+            The synced queue ids, and ``(queue_id, error_message)``
+            pairs for the rows that failed.
+        """
+        (table_name, operation), items = group
+
+        batches: dict[tuple[str, ...], list[tuple[int, str, str]]] = {}
+        for item in items:
+            key_set = tuple(sorted(orjson.loads(item[2])))
+            batches.setdefault(key_set, []).append(item)
+
+        synced_ids: list[int] = []
+        failed: list[tuple[int, str]] = []
+        row_by_row: list[tuple[int, str, str]] = []
+
+        for key_set, batch in batches.items():
+            if len(batch) == 1:
+                row_by_row.extend(batch)
+                continue
             try:
-                self._replay_operation(table_name, operation, entity_id, payload)
-                self._mark_synced(queue_id)
-                synced_count += 1
+                body = "[" + ",".join(raw for _, _, raw in batch) + "]"
+                columns = ",".join(f'"{key}"' for key in key_set)
+                self._send_raw(table_name, operation, "", body, columns)
                 self._logger.debug(
-                    "Synced queue row %d: %s.%s(%s)",
-                    queue_id,
+                    "Synced %d queue rows in one %s.%s request.",
+                    len(batch),
+                    table_name,
+                    operation,
+                )
+                synced_ids.extend(queue_id for queue_id, _, _ in batch)
+            except Exception as exc:
+                self._logger.warning(
+                    "Batched %s.%s of %d rows failed (%s); "
+                    "retrying row by row.",
                     table_name,
                     operation,
-                    entity_id,
+                    len(batch),
+                    exc,
                 )
+                row_by_row.extend(batch)
+
+        for queue_id, entity_id, raw_payload in row_by_row:
+            try:
+                self._replay_operation(table_name, operation, entity_id, raw_payload)
+                synced_ids.append(queue_id)
             except Exception as exc:
                 self._logger.warning(
                     "Failed to sync queue row %d: %s", queue_id, exc,
                 )
-                self._mark_failed(queue_id, str(exc))
+                failed.append((queue_id, str(exc)))
 
-        if synced_count > 0:
-            self._logger.info(
-                "Sync cycle complete: %d/%d rows synced.", synced_count, len(rows),
-            )
+        return synced_ids, failed
 
-        return synced_count
+    def _replay_chain(
+        self, chain: list[_QueueRow],
+    ) -> _ReplayOutcome:
+        """Replay the queued rows of one entity in order.
+
+        Runs on a pool thread.  Performs no SQLite access; outcomes are
+        returned to the caller, which records them in one transaction.
+
+        Parameters
+        ----------
+        chain:
+            ``sync_queue`` rows sharing the same ``entity_id``, in queue
+            order.
+
+        Returns
+        -------
+        tuple[list[int], list[tuple[int, str]]]
+            The synced queue ids, and ``(queue_id, error_message)``
+            pairs for the rows that failed.
+        """
+        synced_ids: list[int] = []
+        failed: list[tuple[int, str]] = []
+        log_debug = self._logger.isEnabledFor(logging.DEBUG)
+
+        for queue_id, table_name, operation, entity_id, raw_payload in chain:
+            try:
+                self._replay_operation(table_name, operation, entity_id, raw_payload)
+                synced_ids.append(queue_id)
+                if log_debug:
+                    self._logger.debug(
+                        "Synced queue row %d: %s.%s(%s)",
+                        queue_id,
+                        table_name,
+                        operation,
+                        entity_id,
+                    )
+            except Exception as exc:
+                self._logger.warning(
+                    "Failed to sync queue row %d: %s", queue_id, exc,
+                )
+                failed.append((queue_id, str(exc)))
+
+        return synced_ids, failed
 
     # ------------------------------------------------------------------
     # Operation dispatcher
@@ -244,54 +551,138 @@ class SyncWorkerService(BaseService):
         table_name: str,
         operation: str,
         entity_id: str,
-        payload: dict[str, object] | list[dict[str, object]],
+        raw_payload: str,
     ) -> None:
         """Replay a single queued operation to Supabase.
 
+        ``insert``, ``update``, ``update_status`` and ``upsert`` forward
+        the queued JSON text as the request body without decoding it;
+        only ``replace`` parses the payload, because it must tell a
+        list of child rows from a single row.
+
         Parameters
         ----------
         table_name:
-            Target Supabase table (must be in ``_ALLOWED_TABLES``).
+            Target Supabase table (must be in ``_ALLOWED_TABLES``, i.e.
+            bound in ``_table_urls``).
         operation:
             One of ``insert``, ``update``, ``update_status``, ``upsert``,
             ``replace``.
         entity_id:
             Primary key or ``transaction_id`` used for WHERE clauses.
-        payload:
-            Deserialised JSON payload (dict for most ops, list for
-            ``replace`` batch operations).
+        raw_payload:
+            The JSON text stored in ``sync_queue.payload`` (an object
+            for most ops, an array for ``replace`` batch operations).
 
         Raises
         ------
         ValueError
             If the table or operation is not recognised.
         """
-        if table_name not in self._ALLOWED_TABLES:
+        if table_name not in self._table_urls:
             raise ValueError(f"Disallowed sync target table: {table_name}")
 
+        if operation in self._RAW_REQUESTS:
+            self._send_raw(table_name, operation, entity_id, raw_payload)
+        elif operation == "replace":
+            self._replay_replace(table_name, entity_id, raw_payload)
+        else:
+            raise ValueError(f"Unknown sync operation: {operation}")
+
+    def _replay_replace(
+        self, table_name: str, transaction_id: str, raw_payload: str,
+    ) -> None:
+        """Replay a ``replace``: swap all child rows of a transaction.
+
+        A list payload deletes the transaction's existing rows and
+        inserts the new ones in a single request; a single object is
+        upserted.
+        """
+        payload: dict[str, object] | list[dict[str, object]] = orjson.loads(raw_payload)
         supabase = self._db.supabase
+        if isinstance(payload, list):
+            supabase.table(table_name).delete().eq(
+                "transaction_id", transaction_id,
+            ).execute()
+            if payload:
+                supabase.table(table_name).insert(payload).execute()
+        else:
+            supabase.table(table_name).upsert(payload).execute()
 
-        if operation == "insert":
-            supabase.table(table_name).insert(payload).execute()
+    def _send_raw(
+        self,
+        table_name: str,
+        operation: str,
+        entity_id: str,
+        body: str,
+        columns: Optional[str] = None,
+    ) -> None:
+        """Send already-serialised JSON to PostgREST on the shared session.
 
-        elif operation in ("update", "update_status"):
-            supabase.table(table_name).update(payload).eq("id", entity_id).execute()
+        Uses the Supabase client's PostgREST session and headers (auth
+        token, schema profile) so the request is identical to the one
+        the query builder would send, minus the decode/re-encode of
+        the body.
 
-        elif operation == "upsert":
-            supabase.table(table_name).upsert(payload).execute()
+        Parameters
+        ----------
+        table_name:
+            Target Supabase table.
+        operation:
+            A key of ``_RAW_REQUESTS``.
+        entity_id:
+            Row ``id`` for updates; ignored for inserts and upserts.
+        body:
+            JSON object or array text.
+        columns:
+            Comma-separated, quoted column names for a JSON-array body,
+            sent as PostgREST's ``columns`` query parameter.
 
-        elif operation == "replace":
-            if isinstance(payload, list):
-                supabase.table(table_name).delete().eq(
-                    "transaction_id", entity_id,
-                ).execute()
-                for item in payload:
-                    supabase.table(table_name).insert(item).execute()
-            else:
-                supabase.table(table_name).upsert(payload).execute()
+        Raises
+        ------
+        RuntimeError
+            If PostgREST answers with a non-2xx status.
+        """
+        method, prefer, by_id = self._RAW_REQUESTS[operation]
+        postgrest = self._db.supabase.postgrest
+        headers = dict(postgrest.headers)
+        headers["Content-Type"] = "application/json"
+        headers["Prefer"] = prefer
+        params: Optional[dict[str, str]] = None
+        if by_id:
+            params = {"id": f"eq.{entity_id}"}
+        elif columns is not None:
+            params = {"columns": columns}
+
+        response = postgrest.session.request(
+            method,
+            self._table_urls[table_name],
+            params=params,
+            content=body,
+            headers=headers,
+        )
+        if not response.is_success:
+            raise RuntimeError(
+                f"PostgREST {method} {table_name} failed "
+                f"({response.status_code}): {response.text}"
+            )
 
-        else:
-            raise ValueError(f"Unknown sync operation: {operation}")
+    def _bind_table_urls(self) -> dict[str, str]:
+        """Resolve the PostgREST endpoint of every allowed table once.
+
+        Doubles as the allow-list: a table without an entry cannot be
+        replayed.  Only URLs are bound — request builders are still
+        created per call because the Supabase client replaces its
+        PostgREST client (and auth headers) when the session token
+        is refreshed.  Empty when offline; the worker is only built
+        for an online ``DatabaseManager``.
+        """
+        if not self._db.is_online:
+            return {}
+        base_url = self._db.supabase.postgrest.base_url
+        return {
+            table: str(base_url.joinpath(table)) for table in self._ALLOWED_TABLES
+        }
 
     # ------------------------------------------------------------------
     # Exponential backoff
@@ -301,61 +692,62 @@ class SyncWorkerService(BaseService):
         """Return the sleep interval for the current failure count.
 
         On zero failures the base interval is used.  Each consecutive
-        failure doubles the interval (capped at ``_MAX_INTERVAL_S``).
+        failure doubles the interval (capped at ``_MAX_INTERVAL_S``),
+        and the actual wait is drawn uniformly from the upper half of
+        that window so that clients recovering from the same outage do
+        not retry against Supabase in lockstep.
         """
         if self._consecutive_failures == 0:
             return self._BASE_INTERVAL_S
 
         backoff = self._BASE_INTERVAL_S * (2 ** min(self._consecutive_failures, 6))
-        return min(backoff, self._MAX_INTERVAL_S)
+        backoff = min(backoff, self._MAX_INTERVAL_S)
+        return self._rng.uniform(backoff / 2, backoff)
 
     # ------------------------------------------------------------------
     # Mark helpers (direct SQLite, with write_lock)
     # ------------------------------------------------------------------
 
-    def _mark_synced(self, queue_id: int) -> None:
-        """Mark a ``sync_queue`` entry as synced."""
-        with self._db.write_lock:
-            self._db.sqlite.execute(
-                """
-                UPDATE sync_queue
-                SET status = 'synced', attempted_at = CURRENT_TIMESTAMP
-                WHERE id = ?
-                """,
-                (queue_id,),
-            )
-            self._db.sqlite.commit()
+    def _mark_outcomes(
+        self,
+        synced_ids: list[int],
+        failed: list[tuple[int, str]],
+    ) -> None:
+        """Record the outcome of a sync cycle in a single transaction.
 
-    def _mark_failed(self, queue_id: int, error_message: str) -> None:
-        """Mark a ``sync_queue`` entry as failed and apply retry logic.
+        Both outcome statements run through ``executemany`` on one
+        prepared statement each, followed by a single ``commit()``.
+        Failed rows increment ``retry_count``: once a row has been
+        attempted ``_MAX_RETRY_COUNT`` times its status becomes
+        ``permanently_failed`` so it is never retried again; otherwise
+        it is reset to ``pending`` for the next cycle.
 
-        If the row has already been attempted ``_MAX_RETRY_COUNT`` times
-        the status is set to ``permanently_failed`` so it is never
-        retried again.  Otherwise the status is reset to ``pending`` for
-        the next cycle.
+        Parameters
+        ----------
+        synced_ids:
+            Queue ids replayed successfully.
+        failed:
+            ``(queue_id, error_message)`` pairs for rows that failed.
         """
+        if not synced_ids and not failed:
+            return
+
         with self._db.write_lock:
-            row = self._db.sqlite.execute(
-                "SELECT error_message FROM sync_queue WHERE id = ?",
-                (queue_id,),
-            ).fetchone()
+            conn = self._db.sqlite
 
-            retry_count: int = 0
-            if row and row["error_message"]:
-                retry_count = str(row["error_message"]).count("Attempt ") + 1
+            if synced_ids:
+                conn.executemany(
+                    _SQL_MARK_SYNCED,
+                    [(queue_id,) for queue_id in synced_ids],
+                )
 
-            if retry_count >= self._MAX_RETRY_COUNT:
-                status = "permanently_failed"
-            else:
-                status = "pending"
-
-            self._db.sqlite.execute(
-                """
-                UPDATE sync_queue
-                SET status = ?, attempted_at = CURRENT_TIMESTAMP,
-                    error_message = ?
-                WHERE id = ?
-                """,
-                (status, f"Attempt {retry_count + 1}: {error_message}", queue_id),
-            )
-            self._db.sqlite.commit()
+            if failed:
+                conn.executemany(
+                    _SQL_MARK_FAILED,
+                    [
+                        (self._MAX_RETRY_COUNT, error_message, queue_id)
+                        for queue_id, error_message in failed
+                    ],
+                )
+
+            conn.commit()
@@ -17,24 +17,36 @@ Functions ported:
 
 from __future__ import annotations
 
-import traceback
+import copy
+import hashlib
+import json
+import queue
+import threading
+from collections import ChainMap
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 from typing import Optional
 
+from pydantic import TypeAdapter
+
 from app.models.user import User
 from app.logger import StructuredLogger
-from app.models.enums import ApprovalStatus, UserRole
+from app.models.enums import ApprovalStatus, Currency, UserRole
 from app.models.fixed_cost import FixedCost
 from app.models.recurring_service import RecurringService
-from app.models.service_models import ServiceResult
-from app.models.transaction import Transaction
+from app.models.service_models import (
+    FinancialEngineInput,
+    ServiceResult,
+)
+from app.models.transaction import FinancialCache, Transaction
 from app.repositories.fixed_cost_repository import FixedCostRepository
 from app.repositories.recurring_service_repository import RecurringServiceRepository
 from app.repositories.transaction_repository import (
     PaginatedTransactions,
     TransactionRepository,
 )
+from app.services.audit_writer import AuditWriterService
 from app.services.base_service import BaseService
 from app.services.email_service import EmailService
 from app.services.financial_engine import (
@@ -43,9 +55,7 @@ from app.services.financial_engine import (
     initialize_timeline,
 )
 from app.services.variables import VariableService
-from app.utils.audit import log_audit_event
-from app.utils.general import convert_to_json_safe
-from app.utils.string_helpers import normalize_keys
+from app.utils.general import convert_via_orjson
 
 
 def _generate_unique_id() -> str:
@@ -58,9 +68,257 @@ def _generate_unique_id() -> str:
         A unique transaction ID string.
     """
     now = datetime.now()
-    year_part: str = now.strftime("%y")
-    datetime_micro_part: str = now.strftime("%m%d%H%M%S%f")
-    return f"FLX{year_part}-{datetime_micro_part}"
+    return (
+        f"FLX{now.year % 100:02d}-"
+        f"{now.month:02d}{now.day:02d}{now.hour:02d}{now.minute:02d}"
+        f"{now.second:02d}{now.microsecond:06d}"
+    )
+
+
+# ``Transaction`` field names.  Recalculated metrics are copied only onto
+# these, tested by set membership rather than ``hasattr`` per key.
+_TRANSACTION_FIELDS: frozenset[str] = frozenset(Transaction.model_fields)
+
+# Scalar fields ``update_transaction_data`` may overwrite.  tipo_cambio,
+# costo_capital_anual and tasa_carta_fianza are deliberately EXCLUDED:
+# those rates are frozen at creation (see master_variables_snapshot).
+_UPDATABLE_FIELDS: tuple[str, ...] = (
+    "unidad_negocio", "client_name", "company_id", "order_id",
+    "mrc_currency", "nrc_currency",
+    "plazo_contrato", "aplica_carta_fianza",
+    "gigalan_region", "gigalan_sale_type", "gigalan_old_mrc",
+)
+
+# Marks "key absent" in a single ``dict.get`` (``None`` is a valid value).
+_MISSING: object = object()
+
+# Transaction fields that a cache hit overwrites from ``financial_cache``;
+# left out of the model dump so they are not serialised twice.
+_CACHED_METRIC_FIELDS: set[str] = set(FinancialCache.model_fields) & _TRANSACTION_FIELDS
+
+# List responses drop the heavy snapshot column.  One adapter dumps the
+# whole page in a single core call instead of one ``model_dump`` per row.
+_TRANSACTION_LIST_ADAPTER: TypeAdapter[list[Transaction]] = TypeAdapter(list[Transaction])
+_TRANSACTION_LIST_EXCLUDE: dict[str, set[str]] = {
+    "__all__": {"master_variables_snapshot"},
+}
+
+# Master variables read by get_transaction_template, mapped to the
+# snake_case keys normalize_keys() would produce for them.
+_TEMPLATE_MASTER_VARS: dict[str, str] = {
+    "tipoCambio": "tipo_cambio",
+    "costoCapital": "costo_capital",
+    "tasaCartaFianza": "tasa_carta_fianza",
+}
+
+# Constant part of the blank transaction returned by
+# get_transaction_template.  Keys marked "set per request" are filled in
+# on a copy; the placeholders keep the response key order unchanged.
+_TEMPLATE_TRANSACTION: dict[str, object] = {
+    "id": None,
+    "unidad_negocio": "",
+    "client_name": "",
+    "company_id": "",
+    "salesman": None,  # Set per request.
+    "order_id": "",
+    "tipo_cambio": None,  # Set per request.
+    "mrc_original": 0,
+    "mrc_currency": "PEN",
+    "mrc_pen": 0,
+    "nrc_original": 0,
+    "nrc_currency": "PEN",
+    "nrc_pen": 0,
+    "van": 0,
+    "tir": 0,
+    "payback": 0,
+    "total_revenue": 0,
+    "total_expense": 0,
+    "comisiones": 0,
+    "comisiones_rate": 0,
+    "costo_instalacion": 0,
+    "costo_instalacion_ratio": 0,
+    "gross_margin": 0,
+    "gross_margin_ratio": 0,
+    "plazo_contrato": None,  # Set per request.
+    "costo_capital_anual": None,  # Set per request.
+    "tasa_carta_fianza": None,  # Set per request.
+    "costo_carta_fianza": 0,
+    "aplica_carta_fianza": True,
+    "gigalan_region": None,
+    "gigalan_sale_type": None,
+    "gigalan_old_mrc": None,
+    "approval_status": ApprovalStatus.PENDING,
+    "submission_date": None,
+    "approval_date": None,
+    "rejection_note": None,
+    "timeline": None,  # Set per request.
+}
+
+# Payload keys copied onto new detail models, with the default used when a
+# key is absent: (field_name, default).
+_FIXED_COST_FIELDS: tuple[tuple[str, object], ...] = (
+    ("categoria", None),
+    ("tipo_servicio", None),
+    ("ticket", None),
+    ("ubicacion", None),
+    ("cantidad", None),
+    ("costo_unitario_original", None),
+    ("costo_unitario_currency", Currency.USD),
+    ("costo_unitario_pen", None),
+    ("periodo_inicio", 0),
+    ("duracion_meses", 1),
+)
+
+_RECURRING_SERVICE_FIELDS: tuple[tuple[str, object], ...] = (
+    ("tipo_servicio", None),
+    ("nota", None),
+    ("ubicacion", None),
+    ("quantity", None),
+    ("price_original", None),
+    ("price_currency", Currency.PEN),
+    ("price_pen", None),
+    ("cost_unit_1_original", None),
+    ("cost_unit_2_original", None),
+    ("cost_unit_currency", Currency.USD),
+    ("cost_unit_1_pen", None),
+    ("cost_unit_2_pen", None),
+    ("proveedor", None),
+)
+
+# Shared zero amount, used as the default for missing originals.
+_ZERO: Decimal = Decimal("0")
+
+# PEN fields derived for a recurring service when blank:
+# (pen_key, original_key, currency_key, default_currency).
+_SERVICE_PEN_FIELDS: tuple[tuple[str, str, str, Currency], ...] = (
+    ("price_pen", "price_original", "price_currency", Currency.PEN),
+    ("cost_unit_1_pen", "cost_unit_1_original", "cost_unit_currency", Currency.USD),
+    ("cost_unit_2_pen", "cost_unit_2_original", "cost_unit_currency", Currency.USD),
+)
+
+
+def _is_blank_amount(value: object) -> bool:
+    """Return ``True`` for a missing, empty, or zero amount.
+
+    ``Decimal("0") == 0`` holds, so the numeric comparison covers both
+    ``int`` and ``Decimal`` zeros without constructing a sentinel.
+    """
+    return value is None or value == "" or value == 0
+
+
+# Distinct engine inputs whose recalculated metrics are kept in memory.
+_METRICS_MEMO_SIZE: int = 1024
+
+# Keys the financial engine actually reads.  Output-only fields (the
+# metrics themselves, ``financial_cache``) are left out of the memo key so
+# applying a result does not change the key for the next recalculation.
+_ENGINE_INPUT_FIELDS: frozenset[str] = frozenset(FinancialEngineInput.model_fields)
+# Per-row inputs only: row ids are assigned on insert and the ``*_pen`` /
+# ``ingreso`` / ``egreso`` fields are engine outputs, so keying on them
+# would make a freshly saved deal and its reloaded copy miss each other.
+# The engine echoes fixed-cost ids into the timeline; those are re-stamped
+# by recalculate_metrics() instead.
+_DETAIL_INPUT_FIELDS: dict[str, frozenset[str]] = {
+    "fixed_costs": frozenset({
+        "categoria", "tipo_servicio", "cantidad",
+        "costo_unitario_original", "costo_unitario_currency",
+        "periodo_inicio", "duracion_meses",
+    }),
+    "recurring_services": frozenset({
+        "quantity", "price_original", "price_currency",
+        "cost_unit_1_original", "cost_unit_2_original", "cost_unit_currency",
+    }),
+}
+_ENGINE_SCALAR_FIELDS: frozenset[str] = (
+    _ENGINE_INPUT_FIELDS & frozenset(Transaction.model_fields)
+) - _DETAIL_INPUT_FIELDS.keys()
+
+
+@lru_cache(maxsize=_METRICS_MEMO_SIZE)
+def _memoized_metrics(engine_input_json: str) -> dict[str, object]:
+    """Recalculate JSON-safe metrics for a canonical engine-input JSON key.
+
+    Decimals are serialised as strings in the key and parsed back
+    exactly, so identical inputs always produce identical metrics.
+    Callers receive the shared cached dict and must copy it before
+    mutating.
+    """
+    engine_input: dict[str, object] = json.loads(
+        engine_input_json, parse_float=Decimal,
+    )
+    return convert_via_orjson(calculate_financial_metrics(engine_input))
+
+
+def _memo_key_number(value: object) -> object:
+    """Spell a number the same way whatever its type or exponent.
+
+    Applied metrics are written back as floats (``mrc_original`` becomes
+    ``1500.5`` rather than ``Decimal("1500.5")``), so without this an
+    unchanged input would miss the memo on the next recalculation.
+    """
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+    elif isinstance(value, int) and not isinstance(value, bool):
+        value = Decimal(value)
+    if isinstance(value, Decimal) and value.is_finite():
+        return format(value.normalize(), "f")
+    return value
+
+
+def _canonical_row(
+    row: dict[str, object], fields: frozenset[str],
+) -> dict[str, object]:
+    """Keep the engine-read keys of a detail row, numbers canonicalised."""
+    return {k: _memo_key_number(v) for k, v in row.items() if k in fields}
+
+
+def metrics_input_key(transaction: Transaction) -> str:
+    """Canonical JSON of everything the engine reads from *transaction*.
+
+    Equal keys mean equal metrics, whether the values came from a
+    payload, from memory, or back from SQLite/Supabase as floats.
+
+    Reads only the engine-input fields straight from the models instead
+    of going through ``Transaction.to_financial_engine_dict()``, whose
+    full ``model_dump`` also serialises ``financial_cache`` and the
+    master-variables snapshot just for them to be discarded here.
+    """
+    values: dict[str, object] = transaction.__dict__
+    canonical: dict[str, object] = {
+        k: _memo_key_number(values[k]) for k in _ENGINE_SCALAR_FIELDS
+    }
+    for k, fields in _DETAIL_INPUT_FIELDS.items():
+        canonical[k] = [_canonical_row(row.__dict__, fields) for row in values[k]]
+    return json.dumps(canonical, sort_keys=True, default=str)
+
+
+def metrics_input_hash(key: str) -> str:
+    """SHA-256 hex digest of a :func:`metrics_input_key`, kept in the cache."""
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def recalculate_metrics(
+    transaction: Transaction,
+    key: Optional[str] = None,
+) -> dict[str, object]:
+    """Return a private copy of the memoized metrics for *transaction*.
+
+    Shared with ``TransactionWorkflowService`` so that an edit applied
+    during approval and the recalculation that follows it cost a single
+    engine run.  Pass *key* when the caller already computed it.
+    """
+    if key is None:
+        key = metrics_input_key(transaction)
+    metrics: dict[str, object] = copy.deepcopy(_memoized_metrics(key))
+    # The memo is shared by every deal with the same inputs, whatever
+    # their fixed-cost row ids, so echo this deal's own ids.
+    timeline = metrics.get("timeline")
+    if isinstance(timeline, dict):
+        for entry, cost in zip(
+            timeline["expenses"]["fixed_costs"], transaction.fixed_costs,
+        ):
+            entry["id"] = cost.id
+    return metrics
 
 
 class TransactionCrudService(BaseService):
@@ -78,6 +336,7 @@ class TransactionCrudService(BaseService):
         recurring_service_repo: RecurringServiceRepository,
         email_service: EmailService,
         variable_service: VariableService,
+        audit_writer: AuditWriterService,
         logger: StructuredLogger,
     ) -> None:
         super().__init__(logger)
@@ -86,6 +345,60 @@ class TransactionCrudService(BaseService):
         self._rs_repo = recurring_service_repo
         self._email_service = email_service
         self._variable_service = variable_service
+        self._audit_writer = audit_writer
+        # Cache self-heal write-behind (see _schedule_cache_self_heal).
+        self._self_heal_queue: queue.SimpleQueue[
+            tuple[str, ApprovalStatus, dict[str, object]]
+        ] = queue.SimpleQueue()
+        self._self_heal_thread: Optional[threading.Thread] = None
+        self._self_heal_lock: threading.Lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Private: financial-cache self-heal write-behind
+    # ------------------------------------------------------------------
+
+    def _schedule_cache_self_heal(self, transaction: Transaction) -> None:
+        """Persist a recalculated ``financial_cache`` off the caller's thread.
+
+        The self-heal only speeds up future reads, so the detail view
+        returns without waiting for the Supabase update.  Only the cache
+        and the status it was computed under are queued for a lazily
+        started daemon thread, which writes ``financial_cache`` alone and
+        only while the status is unchanged -- an approval, rejection or
+        edit made in the meantime is never overwritten.  A failed write
+        is logged and simply retried on the next cache miss.
+
+        Args:
+            transaction: Transaction whose ``financial_cache`` was rebuilt.
+        """
+        self._self_heal_queue.put((
+            transaction.id,
+            transaction.approval_status,
+            dict(transaction.financial_cache),
+        ))
+        with self._self_heal_lock:
+            if self._self_heal_thread is None or not self._self_heal_thread.is_alive():
+                self._self_heal_thread = threading.Thread(
+                    target=self._run_self_heal_loop,
+                    name="CacheSelfHeal",
+                    daemon=True,
+                )
+                self._self_heal_thread.start()
+
+    def _run_self_heal_loop(self) -> None:
+        """Drain the self-heal queue forever (daemon thread)."""
+        while True:
+            transaction_id, status, financial_cache = self._self_heal_queue.get()
+            try:
+                self._tx_repo.update_financial_cache(
+                    transaction_id, financial_cache, status,
+                )
+            except Exception as exc:
+                self._logger.warning(
+                    "Financial cache self-heal failed for %s: %s",
+                    transaction_id,
+                    exc,
+                )
 
     # ------------------------------------------------------------------
     # Private static: enrich recurring service PEN fields
@@ -105,20 +418,210 @@ class TransactionCrudService(BaseService):
             service_item: A single recurring service dict from the payload.
             converter: ``CurrencyConverter`` with the active exchange rate.
         """
-        if service_item.get("price_pen") in [0, Decimal("0"), None, ""]:
-            price_original: Decimal = service_item.get("price_original", Decimal("0"))
-            price_currency: str = service_item.get("price_currency", "PEN")
-            service_item["price_pen"] = converter.to_pen(price_original, price_currency)
+        blank_fields = [
+            spec for spec in _SERVICE_PEN_FIELDS
+            if _is_blank_amount(service_item.get(spec[0]))
+        ]
+        if not blank_fields:
+            return
+
+        converted: list[Decimal] = converter.to_pen_many(
+            (
+                service_item.get(original_key, _ZERO),
+                service_item.get(currency_key, default_currency),
+            )
+            for _, original_key, currency_key, default_currency in blank_fields
+        )
+        for (pen_key, _, _, _), pen_value in zip(blank_fields, converted):
+            service_item[pen_key] = pen_value
 
-        if service_item.get("cost_unit_1_pen") in [0, Decimal("0"), None, ""]:
-            cost_unit_1_original: Decimal = service_item.get("cost_unit_1_original", Decimal("0"))
-            cost_unit_currency: str = service_item.get("cost_unit_currency", "USD")
-            service_item["cost_unit_1_pen"] = converter.to_pen(cost_unit_1_original, cost_unit_currency)
+    @staticmethod
+    def _recalculate_legacy_pen_fields(
+        recurring_services: list[dict[str, object]],
+        tipo_cambio: Optional[Decimal],
+    ) -> None:
+        """Fill ``*_pen`` and ``ingreso_pen`` / ``egreso_pen`` in-place for display.
 
-        if service_item.get("cost_unit_2_pen") in [0, Decimal("0"), None, ""]:
-            cost_unit_2_original: Decimal = service_item.get("cost_unit_2_original", Decimal("0"))
-            cost_unit_currency_2: str = service_item.get("cost_unit_currency", "USD")
-            service_item["cost_unit_2_pen"] = converter.to_pen(cost_unit_2_original, cost_unit_currency_2)
+        Legacy rows may lack PEN values; they are derived from the
+        original amounts.  Returns before building a converter when no
+        service needs recalculation.
+
+        Args:
+            recurring_services: Recurring service dicts (``__dict__`` copies).
+            tipo_cambio: The transaction's exchange rate.
+        """
+        # If _pen fields are missing/zero but original values exist,
+        # recalculate.  One scan gathers the services and the
+        # (value, currency) columns for each group, so each group is then
+        # converted with a single to_pen_many() call.  The dicts come from
+        # model __dict__, so every field key is present and is indexed
+        # directly instead of .get(key, default).
+        revenue_services: list[dict[str, object]] = []
+        price_pairs: list[tuple[Optional[Decimal], Currency]] = []
+        cost_services: list[dict[str, object]] = []
+        cost_pairs: list[tuple[Optional[Decimal], Currency]] = []
+        # Missing, zero and None _pen values are all falsy, so a plain
+        # truth test replaces the blank-amount helper call per service.
+        for service in recurring_services:
+            if not service["quantity"]:
+                continue
+            if not service.get("ingreso_pen") and service["price_original"]:
+                revenue_services.append(service)
+                price_pairs.append((service["price_original"], service["price_currency"]))
+            if not service.get("egreso_pen"):
+                # Two conversions per service (cost_unit_1 then
+                # cost_unit_2) sharing one currency lookup.  Both
+                # components stay separate: cost_unit_1_pen /
+                # cost_unit_2_pen are returned to the detail view, so
+                # converting only their sum would not save any work.
+                cost_currency: Currency = service["cost_unit_currency"]
+                cost_services.append(service)
+                cost_pairs.append((service["cost_unit_1_original"], cost_currency))
+                cost_pairs.append((service["cost_unit_2_original"], cost_currency))
+        if not revenue_services and not cost_services:
+            return
+
+        converter = CurrencyConverter(tipo_cambio or 1)
+
+        price_pens: list[Decimal] = converter.to_pen_many(price_pairs)
+        for service, price_pen in zip(revenue_services, price_pens):
+            service["price_pen"] = price_pen
+            service["ingreso_pen"] = price_pen * service["quantity"]
+
+        cost_unit_pens: list[Decimal] = converter.to_pen_many(cost_pairs)
+        for i, service in enumerate(cost_services):
+            cost_unit_1_pen: Decimal = cost_unit_pens[2 * i]
+            cost_unit_2_pen: Decimal = cost_unit_pens[2 * i + 1]
+            service["cost_unit_1_pen"] = cost_unit_1_pen
+            service["cost_unit_2_pen"] = cost_unit_2_pen
+            service["egreso_pen"] = (cost_unit_1_pen + cost_unit_2_pen) * service["quantity"]
+
+    # ------------------------------------------------------------------
+    # Private static: build detail models from payload dicts
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _build_fixed_costs(
+        transaction_id: str,
+        fixed_costs_data: list[dict[str, object]],
+    ) -> list[FixedCost]:
+        """Build ``FixedCost`` models for *transaction_id* from payload dicts.
+
+        Args:
+            transaction_id: ID of the owning transaction.
+            fixed_costs_data: Fixed cost dicts from the payload.
+
+        Returns:
+            One unsaved ``FixedCost`` per input dict.
+        """
+        return [
+            FixedCost(
+                transaction_id=transaction_id,
+                **{key: item.get(key, default) for key, default in _FIXED_COST_FIELDS},
+            )
+            for item in fixed_costs_data
+        ]
+
+    @classmethod
+    def _build_recurring_services(
+        cls,
+        transaction_id: str,
+        recurring_services_data: list[dict[str, object]],
+        converter: CurrencyConverter,
+    ) -> list[RecurringService]:
+        """Build ``RecurringService`` models, filling blank PEN fields first.
+
+        Each input dict is enriched in-place via
+        :meth:`_enrich_recurring_service_pen_fields`.
+
+        Args:
+            transaction_id: ID of the owning transaction.
+            recurring_services_data: Recurring service dicts from the payload.
+            converter: ``CurrencyConverter`` with the active exchange rate.
+
+        Returns:
+            One unsaved ``RecurringService`` per input dict.
+        """
+        services: list[RecurringService] = []
+        for item in recurring_services_data:
+            cls._enrich_recurring_service_pen_fields(item, converter)
+            services.append(RecurringService(
+                transaction_id=transaction_id,
+                **{key: item.get(key, default) for key, default in _RECURRING_SERVICE_FIELDS},
+            ))
+        return services
+
+    # ------------------------------------------------------------------
+    # Private: per-table create with compensating rollback
+    # ------------------------------------------------------------------
+
+    def _create_with_compensation(
+        self,
+        transaction: Transaction,
+        fixed_costs: list[FixedCost],
+        recurring_services: list[RecurringService],
+    ) -> Transaction:
+        """Create header and details with separate requests (RPC fallback).
+
+        Used when the ``create_transaction_with_details`` RPC is not
+        available (offline, or the Supabase migration is not applied).
+        Header + detail rows must be inserted atomically, so if detail
+        creation fails the orphaned header is deleted via compensating
+        rollback and the error re-raised.
+
+        Args:
+            transaction: The new transaction header.
+            fixed_costs: Fixed cost rows belonging to *transaction*.
+            recurring_services: Recurring service rows belonging to *transaction*.
+
+        Returns:
+            The created transaction.
+        """
+        created_tx: Transaction = self._tx_repo.create(transaction)
+
+        try:
+            # Both SQLite cache mirrors commit once, at the end of the batch.
+            with self._fc_repo._db.batch_write():
+                if fixed_costs:
+                    self._fc_repo.create_batch(created_tx.id, fixed_costs)
+                if recurring_services:
+                    self._rs_repo.create_batch(created_tx.id, recurring_services)
+        except Exception as detail_exc:
+            self._logger.error(
+                "Detail row creation failed for transaction %s; "
+                "rolling back header to prevent orphaned data: %s",
+                created_tx.id,
+                detail_exc,
+            )
+            try:
+                self._tx_repo.supabase.table("transactions").delete().eq(
+                    "id", created_tx.id
+                ).execute()
+            except Exception as rollback_exc:
+                self._logger.error(
+                    "Supabase header rollback also failed for %s: %s",
+                    created_tx.id,
+                    rollback_exc,
+                )
+            # Best-effort cleanup of any partially-created detail rows
+            try:
+                self._fc_repo.supabase.table("fixed_costs").delete().eq(
+                    "transaction_id", created_tx.id
+                ).execute()
+                self._rs_repo.supabase.table("recurring_services").delete().eq(
+                    "transaction_id", created_tx.id
+                ).execute()
+            except Exception as cleanup_error:
+                self._logger.error(
+                    "FK CASCADE cleanup failed for transaction %s: %s. "
+                    "Database may contain orphaned detail rows.",
+                    created_tx.id,
+                    cleanup_error,
+                    exc_info=True,
+                )
+            raise detail_exc
+
+        return created_tx
 
     # ------------------------------------------------------------------
     # Public helper: update transaction data (scalar + relationships)
@@ -148,7 +651,10 @@ class TransactionCrudService(BaseService):
                 }
 
         Returns:
-            ServiceResult indicating success or failure.
+            ServiceResult indicating success or failure.  On success
+            ``data`` is ``{'clean_metrics': dict}`` -- the metrics (with
+            ``input_hash``) already applied to *transaction*, so callers
+            need not recalculate.
         """
         try:
             tx_data: dict[str, object] = data_payload.get("transactions", {})
@@ -156,62 +662,25 @@ class TransactionCrudService(BaseService):
             recurring_services_data: list[dict[str, object]] = data_payload.get("recurring_services", [])
 
             # 1. Update scalar fields on the transaction model
-            # NOTE: tipoCambio, costoCapitalAnual, tasaCartaFianza are EXCLUDED
-            # These rates are frozen at transaction creation and cannot be modified.
-            # See: master_variables_snapshot for audit trail.
-            updatable_fields: list[str] = [
-                "unidad_negocio", "client_name", "company_id", "order_id",
-                "mrc_currency", "nrc_currency",
-                "plazo_contrato", "aplica_carta_fianza",
-                "gigalan_region", "gigalan_sale_type", "gigalan_old_mrc",
-            ]
-
-            for field in updatable_fields:
-                if field in tx_data:
-                    setattr(transaction, field, tx_data[field])
+            # NOTE: the frozen rates are not in _UPDATABLE_FIELDS.
+            get_value = tx_data.get
+            for field in _UPDATABLE_FIELDS:
+                value = get_value(field, _MISSING)
+                if value is not _MISSING:
+                    setattr(transaction, field, value)
 
             # 2. Replace FixedCost records via repository
-            new_fixed_costs: list[FixedCost] = []
-            for cost_item in fixed_costs_data:
-                new_cost = FixedCost(
-                    transaction_id=transaction.id,
-                    categoria=cost_item.get("categoria"),
-                    tipo_servicio=cost_item.get("tipo_servicio"),
-                    ticket=cost_item.get("ticket"),
-                    ubicacion=cost_item.get("ubicacion"),
-                    cantidad=cost_item.get("cantidad"),
-                    costo_unitario_original=cost_item.get("costo_unitario_original"),
-                    costo_unitario_currency=cost_item.get("costo_unitario_currency", "USD"),
-                    costo_unitario_pen=cost_item.get("costo_unitario_pen"),
-                    periodo_inicio=cost_item.get("periodo_inicio", 0),
-                    duracion_meses=cost_item.get("duracion_meses", 1),
-                )
-                new_fixed_costs.append(new_cost)
+            new_fixed_costs: list[FixedCost] = self._build_fixed_costs(
+                transaction.id, fixed_costs_data,
+            )
 
             # 3. Replace RecurringService records via repository
             converter = CurrencyConverter(transaction.tipo_cambio or 1)
-            new_recurring_services: list[RecurringService] = []
-
-            for service_item in recurring_services_data:
-                self._enrich_recurring_service_pen_fields(service_item, converter)
-
-                new_service = RecurringService(
-                    transaction_id=transaction.id,
-                    tipo_servicio=service_item.get("tipo_servicio"),
-                    nota=service_item.get("nota"),
-                    ubicacion=service_item.get("ubicacion"),
-                    quantity=service_item.get("quantity"),
-                    price_original=service_item.get("price_original"),
-                    price_currency=service_item.get("price_currency", "PEN"),
-                    price_pen=service_item.get("price_pen"),
-                    cost_unit_1_original=service_item.get("cost_unit_1_original"),
-                    cost_unit_2_original=service_item.get("cost_unit_2_original"),
-                    cost_unit_currency=service_item.get("cost_unit_currency", "USD"),
-                    cost_unit_1_pen=service_item.get("cost_unit_1_pen"),
-                    cost_unit_2_pen=service_item.get("cost_unit_2_pen"),
-                    proveedor=service_item.get("proveedor"),
+            new_recurring_services: list[RecurringService] = (
+                self._build_recurring_services(
+                    transaction.id, recurring_services_data, converter,
                 )
-                new_recurring_services.append(new_service)
+            )
 
             # Atomic replace: both detail tables in a single SQLite transaction (M4)
             with self._fc_repo._db.batch_write():
@@ -223,32 +692,27 @@ class TransactionCrudService(BaseService):
             transaction.recurring_services = new_recurring_services
 
             # 5. Recalculate financial metrics based on new values
-            financial_metrics: dict[str, object] = calculate_financial_metrics(
-                transaction.to_financial_engine_dict(),
-            ).model_dump()
-            clean_metrics: dict[str, object] = convert_to_json_safe(financial_metrics)
-
-            # 6. Update transaction with fresh calculations
-            for key, value in clean_metrics.items():
-                if hasattr(transaction, key):
-                    setattr(transaction, key, value)
-
-            transaction.costo_instalacion = clean_metrics.get("costo_instalacion")
-            transaction.mrc_original = clean_metrics.get("mrc_original")
-            transaction.mrc_pen = clean_metrics.get("mrc_pen")
-            transaction.nrc_original = clean_metrics.get("nrc_original")
-            transaction.nrc_pen = clean_metrics.get("nrc_pen")
+            input_key: str = metrics_input_key(transaction)
+            clean_metrics: dict[str, object] = recalculate_metrics(
+                transaction, input_key,
+            )
+            clean_metrics["input_hash"] = metrics_input_hash(input_key)
+
+            # 6. Update transaction with fresh calculations (one bulk
+            #    __dict__ update; Transaction does not validate assignment)
+            transaction.__dict__.update(
+                (key, clean_metrics[key])
+                for key in _CACHED_METRIC_FIELDS & clean_metrics.keys()
+            )
 
             # CACHE: Update cached metrics so reads are zero-CPU
             transaction.financial_cache = clean_metrics
 
-            return ServiceResult(success=True)
+            return ServiceResult(success=True, data={"clean_metrics": clean_metrics})
 
         except Exception as exc:
             self._logger.error(
-                "Error during transaction update: %s\n%s",
-                str(exc),
-                traceback.format_exc(),
+                "Error during transaction update: %s", exc, exc_info=True,
             )
             return ServiceResult(
                 success=False,
@@ -282,6 +746,10 @@ class TransactionCrudService(BaseService):
         """
         try:
             tx_data: dict[str, object] = data.get("transactions", {})
+            fixed_costs_data: list[dict[str, object]] = data.get("fixed_costs", [])
+            recurring_services_data: list[dict[str, object]] = data.get(
+                "recurring_services", []
+            )
 
             # --- Validation: require unidad_negocio ---
             unidad_de_negocio: Optional[str] = tx_data.get("unidad_negocio")
@@ -298,17 +766,20 @@ class TransactionCrudService(BaseService):
             # --- Recalculate metrics on backend ---
             clean_metrics: dict[str, object] = {}
             try:
-                full_data_package: dict[str, object] = {
-                    **tx_data,
-                    "fixed_costs": data.get("fixed_costs", []),
-                    "recurring_services": data.get("recurring_services", []),
-                }
+                # Layer the detail lists over tx_data without copying it.
+                full_data_package: ChainMap[str, object] = ChainMap(
+                    {
+                        "fixed_costs": fixed_costs_data,
+                        "recurring_services": recurring_services_data,
+                    },
+                    tx_data,
+                )
 
                 # Recalculate all financial metrics using backend logic
-                recalculated_metrics: dict[str, object] = calculate_financial_metrics(
-                    full_data_package,
-                ).model_dump()
-                clean_metrics = convert_to_json_safe(recalculated_metrics)
+                # (single C-level orjson pass)
+                clean_metrics = convert_via_orjson(
+                    calculate_financial_metrics(full_data_package),
+                )
 
                 # Override frontend values with backend calculations
                 tx_data.update(clean_metrics)
@@ -342,10 +813,10 @@ class TransactionCrudService(BaseService):
                 tipo_cambio=tx_data.get("tipo_cambio"),
                 # MRC / NRC
                 mrc_original=tx_data.get("mrc_original"),
-                mrc_currency=tx_data.get("mrc_currency", "PEN"),
+                mrc_currency=tx_data.get("mrc_currency", Currency.PEN),
                 mrc_pen=tx_data.get("mrc_pen"),
                 nrc_original=tx_data.get("nrc_original"),
-                nrc_currency=tx_data.get("nrc_currency", "PEN"),
+                nrc_currency=tx_data.get("nrc_currency", Currency.PEN),
                 nrc_pen=tx_data.get("nrc_pen"),
                 # KPIs (all in PEN)
                 van=tx_data.get("van"),
@@ -377,94 +848,35 @@ class TransactionCrudService(BaseService):
                 financial_cache=clean_metrics if clean_metrics else None,
             )
 
-            # Persist the transaction via repository
-            created_tx: Transaction = self._tx_repo.create(new_transaction)
-
             # Build fixed cost models
-            fixed_cost_models: list[FixedCost] = []
-            for cost_item in data.get("fixed_costs", []):
-                new_cost = FixedCost(
-                    transaction_id=created_tx.id,
-                    categoria=cost_item.get("categoria"),
-                    tipo_servicio=cost_item.get("tipo_servicio"),
-                    ticket=cost_item.get("ticket"),
-                    ubicacion=cost_item.get("ubicacion"),
-                    cantidad=cost_item.get("cantidad"),
-                    costo_unitario_original=cost_item.get("costo_unitario_original"),
-                    costo_unitario_currency=cost_item.get("costo_unitario_currency", "USD"),
-                    costo_unitario_pen=cost_item.get("costo_unitario_pen"),
-                    periodo_inicio=cost_item.get("periodo_inicio", 0),
-                    duracion_meses=cost_item.get("duracion_meses", 1),
-                )
-                fixed_cost_models.append(new_cost)
+            fixed_cost_models: list[FixedCost] = self._build_fixed_costs(
+                unique_id, fixed_costs_data,
+            )
 
             # Build recurring service models (with PEN conversion)
             save_converter = CurrencyConverter(tx_data.get("tipo_cambio", 1))
-            recurring_service_models: list[RecurringService] = []
-
-            for service_item in data.get("recurring_services", []):
-                self._enrich_recurring_service_pen_fields(service_item, save_converter)
-
-                new_service = RecurringService(
-                    transaction_id=created_tx.id,
-                    tipo_servicio=service_item.get("tipo_servicio"),
-                    nota=service_item.get("nota"),
-                    ubicacion=service_item.get("ubicacion"),
-                    quantity=service_item.get("quantity"),
-                    price_original=service_item.get("price_original"),
-                    price_currency=service_item.get("price_currency", "PEN"),
-                    price_pen=service_item.get("price_pen"),
-                    cost_unit_1_original=service_item.get("cost_unit_1_original"),
-                    cost_unit_2_original=service_item.get("cost_unit_2_original"),
-                    cost_unit_currency=service_item.get("cost_unit_currency", "USD"),
-                    cost_unit_1_pen=service_item.get("cost_unit_1_pen"),
-                    cost_unit_2_pen=service_item.get("cost_unit_2_pen"),
-                    proveedor=service_item.get("proveedor"),
+            recurring_service_models: list[RecurringService] = (
+                self._build_recurring_services(
+                    unique_id, recurring_services_data, save_converter,
                 )
-                recurring_service_models.append(new_service)
+            )
 
-            # --- Atomic detail insertion (CLAUDE.md Section 6) ---
-            # Header + detail rows must be inserted atomically.  If detail
-            # creation fails, delete the orphaned header via compensating rollback.
-            try:
-                if fixed_cost_models:
-                    self._fc_repo.create_batch(created_tx.id, fixed_cost_models)
-                if recurring_service_models:
-                    self._rs_repo.create_batch(created_tx.id, recurring_service_models)
-            except Exception as detail_exc:
-                self._logger.error(
-                    "Detail row creation failed for transaction %s; "
-                    "rolling back header to prevent orphaned data: %s",
-                    created_tx.id,
-                    detail_exc,
-                )
-                try:
-                    self._tx_repo.supabase.table("transactions").delete().eq(
-                        "id", created_tx.id
-                    ).execute()
-                except Exception as rollback_exc:
-                    self._logger.error(
-                        "Supabase header rollback also failed for %s: %s",
-                        created_tx.id,
-                        rollback_exc,
-                    )
-                # Best-effort cleanup of any partially-created detail rows
-                try:
-                    self._fc_repo.supabase.table("fixed_costs").delete().eq(
-                        "transaction_id", created_tx.id
-                    ).execute()
-                    self._rs_repo.supabase.table("recurring_services").delete().eq(
-                        "transaction_id", created_tx.id
-                    ).execute()
-                except Exception as cleanup_error:
-                    self._logger.error(
-                        "FK CASCADE cleanup failed for transaction %s: %s. "
-                        "Database may contain orphaned detail rows.",
-                        created_tx.id,
-                        cleanup_error,
-                        exc_info=True,
+            # --- Atomic header + detail insertion (CLAUDE.md Section 6) ---
+            # One RPC inserts all three tables in a single Postgres
+            # transaction, so there is no partially-created state to undo.
+            created_tx: Optional[Transaction] = self._tx_repo.create_with_details(
+                new_transaction, fixed_cost_models, recurring_service_models,
+            )
+            if created_tx is not None:
+                with self._fc_repo._db.batch_write():
+                    self._fc_repo.cache_for_transaction(created_tx.id, fixed_cost_models)
+                    self._rs_repo.cache_for_transaction(
+                        created_tx.id, recurring_service_models,
                     )
-                raise detail_exc
+            else:
+                created_tx = self._create_with_compensation(
+                    new_transaction, fixed_cost_models, recurring_service_models,
+                )
 
             new_id: str = created_tx.id
             self._logger.info(
@@ -473,9 +885,8 @@ class TransactionCrudService(BaseService):
                 current_user.full_name,
             )
 
-            # Audit trail (dual: log + SQLite)
-            log_audit_event(
-                logger=self._logger,
+            # Audit trail (dual: log now, SQLite on the writer's next batch)
+            self._audit_writer.enqueue(
                 action="CREATE",
                 entity_type="Transaction",
                 entity_id=new_id,
@@ -485,21 +896,15 @@ class TransactionCrudService(BaseService):
                     "unidad_negocio": tx_data.get("unidad_negocio"),
                     "salesman": current_user.full_name,
                 },
-                conn=self._tx_repo.sqlite,
             )
 
-            # Send submission email (non-blocking: log error but do not fail)
-            try:
-                self._email_service.send_new_transaction_email(
-                    salesman_name=current_user.full_name,
-                    client_name=tx_data.get("client_name", "N/A"),
-                    salesman_email=current_user.email,
-                )
-            except Exception as email_err:
-                self._logger.error(
-                    "Transaction saved, but email notification failed: %s",
-                    str(email_err),
-                )
+            # Send submission email in the background: SMTP latency must
+            # not delay the save, and a failure is only logged.
+            self._email_service.submit_new_transaction(
+                salesman_name=current_user.full_name,
+                client_name=tx_data.get("client_name", "N/A"),
+                salesman_email=current_user.email,
+            )
 
             return ServiceResult(
                 success=True,
@@ -511,9 +916,7 @@ class TransactionCrudService(BaseService):
 
         except Exception as exc:
             self._logger.error(
-                "Error during save: %s\n%s",
-                str(exc),
-                traceback.format_exc(),
+                "Error during save: %s", exc, exc_info=True,
             )
             return ServiceResult(
                 success=False,
@@ -567,10 +970,11 @@ class TransactionCrudService(BaseService):
             )
 
             # Column projection: exclude heavy fields from list response
-            transactions_list: list[dict[str, object]] = [
-                tx.model_dump(exclude={"master_variables_snapshot"})
-                for tx in result["items"]
-            ]
+            transactions_list: list[dict[str, object]] = (
+                _TRANSACTION_LIST_ADAPTER.dump_python(
+                    result["items"], exclude=_TRANSACTION_LIST_EXCLUDE,
+                )
+            )
 
             return ServiceResult(
                 success=True,
@@ -634,98 +1038,91 @@ class TransactionCrudService(BaseService):
                     status_code=403,
                 )
 
-            # Hydrate relationships from repositories
-            fixed_costs: list[FixedCost] = self._fc_repo.get_by_transaction(transaction_id)
-            recurring_services: list[RecurringService] = self._rs_repo.get_by_transaction(transaction_id)
-            transaction.fixed_costs = fixed_costs
-            transaction.recurring_services = recurring_services
-
-            # --- PERFORMANCE OPTIMIZATION: Use cache for immutable transactions ---
-            if transaction.financial_cache:
-                # Cache hit -- use stored metrics (zero CPU cost)
-                clean_financial_metrics: dict[str, object] = (
-                    transaction.financial_cache.model_dump()
-                    if hasattr(transaction.financial_cache, "model_dump")
-                    else transaction.financial_cache
-                )
-                transaction_details: dict[str, object] = transaction.model_dump()
-                transaction_details.update(clean_financial_metrics)
-            else:
-                # Cache miss (legacy data or failed cache write) -- recalculate and self-heal
-                self._logger.info(
-                    "Cache miss for %s transaction %s - self-healing",
-                    transaction.approval_status,
-                    transaction.id,
-                )
-
-                # 1. Calculate and cache the metrics
-                financial_metrics: dict[str, object] = calculate_financial_metrics(
-                    transaction.to_financial_engine_dict(),
-                ).model_dump()
-                clean_financial_metrics = convert_to_json_safe(financial_metrics)
-
-                # 3. Self-heal: Update the cache for future requests
-                transaction.financial_cache = clean_financial_metrics
-                self._tx_repo.update(transaction)
-
-                # 4. Merge into transaction details
-                transaction_details = transaction.model_dump()
-                transaction_details.update(clean_financial_metrics)
-
-            # --- FIX: Recalculate _pen fields if missing (for legacy data) ---
-            recurring_services_list: list[dict[str, object]] = [
-                rs.model_dump() for rs in transaction.recurring_services
-            ]
-            converter = CurrencyConverter(transaction.tipo_cambio or 1)
-
-            for service in recurring_services_list:
-                # If _pen fields are missing/zero but original values exist, recalculate
-                if (
-                    service.get("ingreso_pen") in [0, Decimal("0"), None]
-                    and service.get("price_original")
-                    and service.get("quantity")
-                ):
-                    price_pen: Decimal = converter.to_pen(
-                        service["price_original"],
-                        service.get("price_currency", "PEN"),
-                    )
-                    service["price_pen"] = price_pen
-                    service["ingreso_pen"] = price_pen * service["quantity"]
-
-                if service.get("egreso_pen") in [0, Decimal("0"), None] and service.get("quantity"):
-                    cost_unit_1_pen: Decimal = converter.to_pen(
-                        service.get("cost_unit_1_original", Decimal("0")),
-                        service.get("cost_unit_currency", "USD"),
-                    )
-                    cost_unit_2_pen: Decimal = converter.to_pen(
-                        service.get("cost_unit_2_original", Decimal("0")),
-                        service.get("cost_unit_currency", "USD"),
-                    )
-                    service["cost_unit_1_pen"] = cost_unit_1_pen
-                    service["cost_unit_2_pen"] = cost_unit_2_pen
-                    service["egreso_pen"] = (cost_unit_1_pen + cost_unit_2_pen) * service["quantity"]
-
-            return ServiceResult(
-                success=True,
-                data={
-                    "transactions": transaction_details,
-                    "fixed_costs": [fc.model_dump() for fc in transaction.fixed_costs],
-                    "recurring_services": recurring_services_list,
-                },
+            # Hydrate relationships (both detail tables in one call)
+            transaction.fixed_costs, transaction.recurring_services = (
+                self._tx_repo.get_relationships(transaction_id)
             )
+
+            return self._serialize_transaction(transaction)
         except Exception as exc:
             self._logger.error(
                 "Error retrieving transaction detail for %s: %s",
                 transaction_id,
-                str(exc),
+                exc,
                 exc_info=True,
             )
             return ServiceResult(
                 success=False,
-                error=f"An unexpected error occurred: {str(exc)}",
+                error="An unexpected error occurred.",
                 status_code=500,
             )
 
+    def _serialize_transaction(self, transaction: Transaction) -> ServiceResult:
+        """Build the detail response for a hydrated *transaction*.
+
+        Shared by :meth:`get_transaction_detail` and
+        :meth:`update_transaction_content`, which already holds the
+        updated transaction and its detail rows in memory.
+
+        Args:
+            transaction: Transaction with ``fixed_costs`` and
+                ``recurring_services`` populated.
+
+        Returns:
+            ServiceResult with transaction data, fixed costs, and
+            recurring services.
+        """
+        # --- PERFORMANCE OPTIMIZATION: Use cache for immutable transactions ---
+        if transaction.financial_cache:
+            # Cache hit -- use stored metrics (zero CPU cost)
+            clean_financial_metrics: dict[str, object] = (
+                transaction.financial_cache.model_dump()
+                if hasattr(transaction.financial_cache, "model_dump")
+                else transaction.financial_cache
+            )
+            transaction_details: dict[str, object] = transaction.model_dump(
+                exclude=_CACHED_METRIC_FIELDS,
+            )
+            transaction_details.update(clean_financial_metrics)
+        else:
+            # Cache miss (legacy data or failed cache write) -- recalculate and self-heal
+            self._logger.info(
+                "Cache miss for %s transaction %s - self-healing",
+                transaction.approval_status,
+                transaction.id,
+            )
+
+            # 1. Calculate the metrics (memoized: retries of the same
+            #    uncached transaction skip the engine)
+            clean_financial_metrics = recalculate_metrics(transaction)
+
+            # 3. Self-heal: Update the cache for future requests
+            transaction.financial_cache = clean_financial_metrics
+            self._schedule_cache_self_heal(transaction)
+
+            # 4. Merge into transaction details
+            transaction_details = transaction.model_dump()
+            transaction_details.update(clean_financial_metrics)
+
+        # --- FIX: Recalculate _pen fields if missing (for legacy data) ---
+        # Detail models hold only scalar fields, so a shallow copy of
+        # __dict__ equals model_dump() without the serializer pass.
+        recurring_services_list: list[dict[str, object]] = [
+            dict(rs.__dict__) for rs in transaction.recurring_services
+        ]
+        self._recalculate_legacy_pen_fields(
+            recurring_services_list, transaction.tipo_cambio,
+        )
+
+        return ServiceResult(
+            success=True,
+            data={
+                "transactions": transaction_details,
+                "fixed_costs": [dict(fc.__dict__) for fc in transaction.fixed_costs],
+                "recurring_services": recurring_services_list,
+            },
+        )
+
     # ------------------------------------------------------------------
     # Public: update_transaction_content
     # ------------------------------------------------------------------
@@ -786,30 +1183,30 @@ class TransactionCrudService(BaseService):
             # 5. Persist the changes via repository
             self._tx_repo.update(transaction)
 
-            # 6. Audit trail (dual: log + SQLite)
-            log_audit_event(
-                logger=self._logger,
+            # 6. Audit trail (dual: log now, SQLite on the writer's next batch)
+            self._audit_writer.enqueue(
                 action="UPDATE_CONTENT",
                 entity_type="Transaction",
                 entity_id=transaction_id,
                 user_id=current_user.id,
                 details={"updated_by": current_user.full_name},
-                conn=self._tx_repo.sqlite,
             )
 
-            # 7. Return the updated transaction details
-            return self.get_transaction_detail(transaction_id, current_user)
+            # 7. Return the updated transaction details from memory: the
+            #    header, detail rows and financial_cache were all just
+            #    written, so nothing needs to be read back.
+            return self._serialize_transaction(transaction)
 
         except Exception as exc:
             self._logger.error(
                 "Error updating transaction content for ID %s: %s",
                 transaction_id,
-                str(exc),
+                exc,
                 exc_info=True,
             )
             return ServiceResult(
                 success=False,
-                error=f"Error updating transaction: {str(exc)}",
+                error="Error updating transaction.",
                 status_code=500,
             )
 
@@ -835,14 +1232,15 @@ class TransactionCrudService(BaseService):
         """
         try:
             # 1. Fetch current MasterVariables
-            required_vars: list[str] = ["tipoCambio", "costoCapital", "tasaCartaFianza"]
+            required_vars: list[str] = list(_TEMPLATE_MASTER_VARS)
             master_vars: dict[str, Optional[Decimal]] = self._variable_service.get_latest_master_variables(
                 required_vars
             )
 
             # 2. Validate all required variables exist
+            get_var = master_vars.get
             missing_vars: list[str] = [
-                var for var in required_vars if master_vars.get(var) is None
+                var for var in required_vars if get_var(var) is None
             ]
             if missing_vars:
                 return ServiceResult(
@@ -852,51 +1250,24 @@ class TransactionCrudService(BaseService):
                 )
 
             # 3. Normalize keys at the boundary (Section 4D)
-            master_vars = normalize_keys(master_vars)
+            master_vars = {
+                snake_key: master_vars[camel_key]
+                for camel_key, snake_key in _TEMPLATE_MASTER_VARS.items()
+            }
 
             # 4. Build the default transaction template
             default_plazo: int = 36  # Default contract term in months
 
-            template_transaction: dict[str, object] = {
-                "id": None,
-                "unidad_negocio": "",
-                "client_name": "",
-                "company_id": "",
-                "salesman": current_user.full_name,
-                "order_id": "",
-                "tipo_cambio": master_vars["tipo_cambio"],
-                "mrc_original": 0,
-                "mrc_currency": "PEN",
-                "mrc_pen": 0,
-                "nrc_original": 0,
-                "nrc_currency": "PEN",
-                "nrc_pen": 0,
-                "van": 0,
-                "tir": 0,
-                "payback": 0,
-                "total_revenue": 0,
-                "total_expense": 0,
-                "comisiones": 0,
-                "comisiones_rate": 0,
-                "costo_instalacion": 0,
-                "costo_instalacion_ratio": 0,
-                "gross_margin": 0,
-                "gross_margin_ratio": 0,
-                "plazo_contrato": default_plazo,
-                "costo_capital_anual": master_vars["costo_capital"],
-                "tasa_carta_fianza": master_vars["tasa_carta_fianza"],
-                "costo_carta_fianza": 0,
-                "aplica_carta_fianza": True,
-                "gigalan_region": None,
-                "gigalan_sale_type": None,
-                "gigalan_old_mrc": None,
-                "approval_status": ApprovalStatus.PENDING,
-                "submission_date": None,
-                "approval_date": None,
-                "rejection_note": None,
+            template_transaction: dict[str, object] = dict(_TEMPLATE_TRANSACTION)
+            template_transaction.update(
+                salesman=current_user.full_name,
+                tipo_cambio=master_vars["tipo_cambio"],
+                plazo_contrato=default_plazo,
+                costo_capital_anual=master_vars["costo_capital"],
+                tasa_carta_fianza=master_vars["tasa_carta_fianza"],
                 # Include empty timeline for frontend compatibility
-                "timeline": initialize_timeline(default_plazo),
-            }
+                timeline=initialize_timeline(default_plazo),
+            )
 
             return ServiceResult(
                 success=True,
@@ -910,11 +1281,11 @@ class TransactionCrudService(BaseService):
         except Exception as exc:
             self._logger.error(
                 "Error generating transaction template: %s",
-                str(exc),
+                exc,
                 exc_info=True,
             )
             return ServiceResult(
                 success=False,
-                error=f"An unexpected error occurred: {str(exc)}",
+                error="An unexpected error occurred.",
                 status_code=500,
             )
@@ -11,13 +11,12 @@ Functions ported:
 
 from __future__ import annotations
 
-import traceback
 from app.models.user import User
 from app.logger import StructuredLogger
-from app.models.service_models import ServiceResult
+from app.models.service_models import FinancialMetricsResult, ServiceResult
 from app.services.base_service import BaseService
 from app.services.financial_engine import calculate_financial_metrics
-from app.utils.general import convert_to_json_safe
+from app.utils.general import convert_via_orjson
 
 
 class TransactionPreviewService(BaseService):
@@ -70,7 +69,7 @@ class TransactionPreviewService(BaseService):
 
             # 2. Build the complete data dictionary
             # This mimics the data package created in 'process_excel_file'
-            full_data_package: dict[str, object] = {**transaction_data}
+            full_data_package: dict[str, object] = transaction_data.copy()
 
             # --- Validation: check required rates in the data packet ---
             if (
@@ -92,24 +91,25 @@ class TransactionPreviewService(BaseService):
             full_data_package["recurring_services"] = recurring_services_data
 
             # Calculate costo_instalacion as the sum of fixed cost totals
-            # (original currency total -- calculate_financial_metrics handles PEN conversion)
+            # (original currency total -- calculate_financial_metrics handles PEN conversion).
+            # One lookup per item; null totals are skipped.
+            fixed_cost_totals = (item.get("total") for item in fixed_costs_data)
             full_data_package["costo_instalacion"] = sum(
-                item.get("total", 0)
-                for item in fixed_costs_data
-                if item.get("total") is not None
+                total for total in fixed_cost_totals if total is not None
             )
 
             # 3. Call the stateless calculator
-            financial_metrics: dict[str, object] = calculate_financial_metrics(
+            financial_metrics: FinancialMetricsResult = calculate_financial_metrics(
                 full_data_package,
-            ).model_dump()
+            )
 
-            # 4. Clean and return the results
-            clean_metrics: dict[str, object] = convert_to_json_safe(financial_metrics)
+            # 4. Clean and return the results (single C-level orjson pass)
+            clean_metrics: dict[str, object] = convert_via_orjson(financial_metrics)
 
             # 5. Merge the original transaction inputs with the newly calculated metrics
             # This ensures inputs like 'plazoContrato' are returned in the response
-            final_data: dict[str, object] = {**transaction_data, **clean_metrics}
+            final_data: dict[str, object] = dict(transaction_data)
+            final_data.update(clean_metrics)
 
             return ServiceResult(
                 success=True,
@@ -118,12 +118,12 @@ class TransactionPreviewService(BaseService):
 
         except Exception as exc:
             self._logger.error(
-                "Error during preview calculation: %s\n%s",
-                str(exc),
-                traceback.format_exc(),
+                "Error during preview calculation: %s",
+                exc,
+                exc_info=True,
             )
             return ServiceResult(
                 success=False,
-                error=f"An unexpected error occurred during preview: {str(exc)}",
+                error="An unexpected error occurred during preview.",
                 status_code=500,
             )
@@ -13,6 +13,7 @@ Functions ported:
 
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -20,18 +21,31 @@ from typing import Optional
 from app.models.user import User
 from app.logger import StructuredLogger
 from app.models.enums import ApprovalStatus, BusinessUnit, UserRole
-from app.models.service_models import ServiceResult
+from app.models.service_models import FinancialMetricsResult, ServiceResult
 from app.models.transaction import Transaction
 from app.repositories.fixed_cost_repository import FixedCostRepository
 from app.repositories.recurring_service_repository import RecurringServiceRepository
 from app.repositories.transaction_repository import TransactionRepository
+from app.services.audit_writer import AuditWriterService
 from app.services.base_service import BaseService
 from app.services.email_service import EmailService
 from app.services.file_archival import FileArchivalService
-from app.services.financial_engine import calculate_financial_metrics
-from app.services.transaction_crud import TransactionCrudService
-from app.utils.audit import log_audit_event
-from app.utils.general import convert_to_json_safe
+from app.services.transaction_crud import (
+    TransactionCrudService,
+    metrics_input_hash,
+    metrics_input_key,
+    recalculate_metrics,
+)
+
+
+# Roles allowed to approve, reject and recalculate transactions.
+_APPROVER_ROLES: frozenset[UserRole] = frozenset({UserRole.FINANCE, UserRole.ADMIN})
+
+# Engine outputs that are also ``Transaction`` fields -- the only metrics
+# copied onto the model (``timeline`` lives in ``financial_cache`` alone).
+_METRIC_FIELDS: frozenset[str] = frozenset(
+    FinancialMetricsResult.model_fields,
+) & frozenset(Transaction.model_fields)
 
 
 class TransactionWorkflowService(BaseService):
@@ -50,6 +64,7 @@ class TransactionWorkflowService(BaseService):
         email_service: EmailService,
         crud_service: TransactionCrudService,
         file_archival: FileArchivalService,
+        audit_writer: AuditWriterService,
         logger: StructuredLogger,
     ) -> None:
         super().__init__(logger)
@@ -59,6 +74,32 @@ class TransactionWorkflowService(BaseService):
         self._email_service = email_service
         self._crud_service = crud_service
         self._file_archival = file_archival
+        self._audit_writer = audit_writer
+        # Runs file archival alongside approval preparation.
+        self._archival_executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="FileArchival",
+        )
+
+    # ------------------------------------------------------------------
+    # Private helper: RBAC check
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _require_approver(
+        current_user: User, action: str,
+    ) -> Optional[ServiceResult]:
+        """Return a 403 result unless *current_user* may *action* transactions.
+
+        Purely in-memory, so callers run it before any DB read or file move.
+        """
+        if current_user.role in _APPROVER_ROLES:
+            return None
+        return ServiceResult(
+            success=False,
+            error=f"Only FINANCE or ADMIN users can {action} transactions.",
+            status_code=403,
+        )
 
     # ------------------------------------------------------------------
     # Private helper: recalculate and apply financial metrics
@@ -72,28 +113,40 @@ class TransactionWorkflowService(BaseService):
         Assemble data package, recalculate financial metrics, and apply
         them to the transaction model.
 
+        When ``financial_cache`` was computed from the same engine input
+        (matching ``input_hash``) the cache is returned as-is and nothing
+        is recalculated.
+
         Args:
             transaction: The Transaction object to recalculate.
 
         Returns:
             The clean metrics dictionary that was applied.
         """
-        # Recalculate financial metrics
-        financial_metrics: dict[str, object] = calculate_financial_metrics(
-            transaction.to_financial_engine_dict(),
-        ).model_dump()
-        clean_metrics: dict[str, object] = convert_to_json_safe(financial_metrics)
-
-        # Update transaction with fresh calculations
-        for key, value in clean_metrics.items():
-            if hasattr(transaction, key):
-                setattr(transaction, key, value)
-
-        transaction.costo_instalacion = clean_metrics.get("costo_instalacion")
-        transaction.mrc_original = clean_metrics.get("mrc_original")
-        transaction.mrc_pen = clean_metrics.get("mrc_pen")
-        transaction.nrc_original = clean_metrics.get("nrc_original")
-        transaction.nrc_pen = clean_metrics.get("nrc_pen")
+        input_key: str = metrics_input_key(transaction)
+        input_hash: str = metrics_input_hash(input_key)
+
+        cached = transaction.financial_cache
+        if cached is not None:
+            cached_metrics: dict[str, object] = (
+                cached.model_dump() if hasattr(cached, "model_dump") else cached
+            )
+            if cached_metrics.get("input_hash") == input_hash:
+                return cached_metrics
+
+        # Recalculate financial metrics (memoized on the engine input, so a
+        # data_payload edit that already recalculated costs no second run)
+        clean_metrics: dict[str, object] = recalculate_metrics(
+            transaction, input_key,
+        )
+        clean_metrics["input_hash"] = input_hash
+
+        # Update transaction with fresh calculations.  Transaction is a plain
+        # Pydantic model (no validate_assignment, no ORM change tracking),
+        # so one bulk __dict__ update replaces a __setattr__ per field.
+        transaction.__dict__.update(
+            (key, clean_metrics[key]) for key in _METRIC_FIELDS & clean_metrics.keys()
+        )
 
         # Cache financial metrics for zero-CPU reads
         transaction.financial_cache = clean_metrics
@@ -105,9 +158,10 @@ class TransactionWorkflowService(BaseService):
     # ------------------------------------------------------------------
 
     def _hydrate_relationships(self, transaction: Transaction) -> None:
-        """Load fixed costs and recurring services from repositories."""
-        transaction.fixed_costs = self._fc_repo.get_by_transaction(transaction.id)
-        transaction.recurring_services = self._rs_repo.get_by_transaction(transaction.id)
+        """Load fixed costs and recurring services in one repository call."""
+        transaction.fixed_costs, transaction.recurring_services = (
+            self._tx_repo.get_relationships(transaction.id)
+        )
 
     # ------------------------------------------------------------------
     # Public: approve_transaction
@@ -124,7 +178,8 @@ class TransactionWorkflowService(BaseService):
 
         Immutability Check: Only allows approval if status is 'PENDING'.
         Recalculates financial metrics before approval to ensure the database
-        has the latest calculated values (prevents stale data).
+        has the latest calculated values (prevents stale data); without a
+        ``data_payload`` an existing ``financial_cache`` is kept as stored.
 
         Args:
             transaction_id: The ID of the transaction to approve.
@@ -137,14 +192,42 @@ class TransactionWorkflowService(BaseService):
         Returns:
             ServiceResult indicating success or failure.
         """
+        prepared: ServiceResult = self._prepare_approval(
+            transaction_id, current_user, data_payload,
+        )
+        if not prepared.success:
+            return prepared
+        return self._commit_approval(prepared.data, current_user, data_payload)
+
+    def _prepare_approval(
+        self,
+        transaction_id: str,
+        current_user: User,
+        data_payload: Optional[dict[str, object]],
+    ) -> ServiceResult:
+        """
+        Read-only first half of :meth:`approve_transaction`.
+
+        Runs the RBAC and state checks, then hydrates relationships and,
+        when there is no ``data_payload`` to apply, recalculates metrics in
+        memory -- unless there is no payload and ``financial_cache`` is
+        already stored, in which case both are skipped.  Nothing is
+        written, so the approval can still be abandoned (e.g. when
+        archiving the source file fails).
+
+        Args:
+            transaction_id: The ID of the transaction to approve.
+            current_user: The authenticated user performing the approval.
+            data_payload: The pending data updates, if any.
+
+        Returns:
+            ServiceResult whose ``data`` is the prepared Transaction.
+        """
         try:
             # --- RBAC CHECK: Only FINANCE and ADMIN can approve ---
-            if current_user.role not in (UserRole.FINANCE, UserRole.ADMIN):
-                return ServiceResult(
-                    success=False,
-                    error="Only FINANCE or ADMIN users can approve transactions.",
-                    status_code=403,
-                )
+            forbidden = self._require_approver(current_user, "approve")
+            if forbidden is not None:
+                return forbidden
 
             transaction: Optional[Transaction] = self._tx_repo.get_by_id(transaction_id)
             if not transaction:
@@ -166,9 +249,46 @@ class TransactionWorkflowService(BaseService):
                     status_code=400,
                 )
 
-            # Hydrate relationships
-            self._hydrate_relationships(transaction)
+            # Approving without edits: the stored financial_cache was written
+            # with the last edit, so hydration and recalculation are skipped.
+            if data_payload or not transaction.financial_cache:
+                # Hydrate relationships
+                self._hydrate_relationships(transaction)
+
+                # --- Recalculate metrics before approval ---
+                # With a data_payload this waits for _commit_approval, which
+                # applies (and writes) the updates first.
+                if not data_payload:
+                    calc_error = self._recalculate_before_approval(transaction)
+                    if calc_error is not None:
+                        return calc_error
+
+            return ServiceResult(success=True, data=transaction)
+        except Exception as exc:
+            return self._approval_error(transaction_id, exc)
+
+    def _commit_approval(
+        self,
+        transaction: Transaction,
+        current_user: User,
+        data_payload: Optional[dict[str, object]],
+    ) -> ServiceResult:
+        """
+        Writing second half of :meth:`approve_transaction`.
+
+        Applies ``data_payload`` (recalculating afterwards), then persists
+        the APPROVED status, records the audit event and notifies by email.
+
+        Args:
+            transaction: The Transaction returned by :meth:`_prepare_approval`.
+            current_user: The authenticated user performing the approval.
+            data_payload: Optional updated transaction data to apply first.
 
+        Returns:
+            ServiceResult indicating success or failure.
+        """
+        transaction_id: str = transaction.id
+        try:
             # --- Apply data updates if provided ---
             if data_payload:
                 update_result: ServiceResult = self._crud_service.update_transaction_data(
@@ -177,21 +297,11 @@ class TransactionWorkflowService(BaseService):
                 if not update_result.success:
                     return update_result
 
-            # --- Recalculate metrics before approval ---
-            try:
-                self._recalculate_and_apply_metrics(transaction)
-            except Exception as calc_error:
-                self._logger.error(
-                    "Error recalculating metrics before approval for ID %s: %s",
-                    transaction_id,
-                    str(calc_error),
-                    exc_info=True,
-                )
-                return ServiceResult(
-                    success=False,
-                    error="Cannot approve: financial metric recalculation failed. Please retry or contact support.",
-                    status_code=500,
-                )
+                # The CRUD update already recalculated and applied metrics.
+                if not (update_result.data or {}).get("clean_metrics"):
+                    calc_error = self._recalculate_before_approval(transaction)
+                    if calc_error is not None:
+                        return calc_error
 
             # Update status
             transaction.approval_status = ApprovalStatus.APPROVED
@@ -200,9 +310,8 @@ class TransactionWorkflowService(BaseService):
             # Persist via repository
             self._tx_repo.update(transaction)
 
-            # Audit trail (dual: log + SQLite)
-            log_audit_event(
-                logger=self._logger,
+            # Audit trail (dual: log now, SQLite on the writer's next batch)
+            self._audit_writer.enqueue(
                 action="APPROVE",
                 entity_type="Transaction",
                 entity_id=transaction_id,
@@ -211,34 +320,53 @@ class TransactionWorkflowService(BaseService):
                     "approved_by": current_user.full_name,
                     "client_name": transaction.client_name,
                 },
-                conn=self._tx_repo.sqlite,
             )
 
-            # Send approval email (non-blocking)
-            try:
-                self._email_service.send_status_update_email(transaction, "APPROVED")
-            except Exception as email_err:
-                self._logger.error(
-                    "Transaction approved, but email notification failed: %s",
-                    str(email_err),
-                )
+            # Send approval email in the background: SMTP latency must not
+            # delay the response, and a failure is only logged.
+            self._email_service.submit_status_update(transaction, "APPROVED")
 
             return ServiceResult(
                 success=True,
                 data={"message": "Transaction approved successfully."},
             )
         except Exception as exc:
+            return self._approval_error(transaction_id, exc)
+
+    def _recalculate_before_approval(
+        self,
+        transaction: Transaction,
+    ) -> Optional[ServiceResult]:
+        """Recalculate metrics; return the error result if that fails."""
+        try:
+            self._recalculate_and_apply_metrics(transaction)
+        except Exception as calc_error:
             self._logger.error(
-                "Error during transaction approval for ID %s: %s",
-                transaction_id,
-                str(exc),
+                "Error recalculating metrics before approval for ID %s: %s",
+                transaction.id,
+                str(calc_error),
                 exc_info=True,
             )
             return ServiceResult(
                 success=False,
-                error=f"Database error: {str(exc)}",
+                error="Cannot approve: financial metric recalculation failed. Please retry or contact support.",
                 status_code=500,
             )
+        return None
+
+    def _approval_error(self, transaction_id: str, exc: Exception) -> ServiceResult:
+        """Log an unexpected approval failure and wrap it for the caller."""
+        self._logger.error(
+            "Error during transaction approval for ID %s: %s",
+            transaction_id,
+            str(exc),
+            exc_info=True,
+        )
+        return ServiceResult(
+            success=False,
+            error=f"Database error: {str(exc)}",
+            status_code=500,
+        )
 
     # ------------------------------------------------------------------
     # Public: reject_transaction
@@ -256,7 +384,8 @@ class TransactionWorkflowService(BaseService):
 
         Immutability Check: Only allows rejection if status is 'PENDING'.
         Recalculates financial metrics before rejection to ensure the database
-        has the latest calculated values (prevents stale data).
+        has the latest calculated values (prevents stale data); without a
+        ``data_payload`` an existing ``financial_cache`` is kept as stored.
 
         Args:
             transaction_id: The ID of the transaction to reject.
@@ -272,12 +401,9 @@ class TransactionWorkflowService(BaseService):
         """
         try:
             # --- RBAC CHECK: Only FINANCE and ADMIN can reject ---
-            if current_user.role not in (UserRole.FINANCE, UserRole.ADMIN):
-                return ServiceResult(
-                    success=False,
-                    error="Only FINANCE or ADMIN users can reject transactions.",
-                    status_code=403,
-                )
+            forbidden = self._require_approver(current_user, "reject")
+            if forbidden is not None:
+                return forbidden
 
             transaction: Optional[Transaction] = self._tx_repo.get_by_id(transaction_id)
             if not transaction:
@@ -299,32 +425,41 @@ class TransactionWorkflowService(BaseService):
                     status_code=400,
                 )
 
-            # Hydrate relationships
-            self._hydrate_relationships(transaction)
-
-            # --- Apply data updates if provided ---
-            if data_payload:
-                update_result: ServiceResult = self._crud_service.update_transaction_data(
-                    transaction, data_payload
-                )
-                if not update_result.success:
-                    return update_result
-
-            # --- Recalculate metrics before rejection ---
-            try:
-                self._recalculate_and_apply_metrics(transaction)
-            except Exception as calc_error:
-                self._logger.error(
-                    "Error recalculating metrics before rejection for ID %s: %s",
-                    transaction_id,
-                    str(calc_error),
-                    exc_info=True,
-                )
-                return ServiceResult(
-                    success=False,
-                    error="Cannot reject: financial metric recalculation failed. Please retry or contact support.",
-                    status_code=500,
-                )
+            # Rejecting without edits: the stored financial_cache was written
+            # with the last edit, so hydration and recalculation are skipped.
+            if data_payload or not transaction.financial_cache:
+                # Hydrate relationships
+                self._hydrate_relationships(transaction)
+
+                # --- Apply data updates if provided ---
+                metrics_applied: bool = False
+                if data_payload:
+                    update_result: ServiceResult = self._crud_service.update_transaction_data(
+                        transaction, data_payload
+                    )
+                    if not update_result.success:
+                        return update_result
+                    # The CRUD update already recalculated and applied metrics.
+                    metrics_applied = bool(
+                        (update_result.data or {}).get("clean_metrics"),
+                    )
+
+                # --- Recalculate metrics before rejection ---
+                if not metrics_applied:
+                    try:
+                        self._recalculate_and_apply_metrics(transaction)
+                    except Exception as calc_error:
+                        self._logger.error(
+                            "Error recalculating metrics before rejection for ID %s: %s",
+                            transaction_id,
+                            str(calc_error),
+                            exc_info=True,
+                        )
+                        return ServiceResult(
+                            success=False,
+                            error="Cannot reject: financial metric recalculation failed. Please retry or contact support.",
+                            status_code=500,
+                        )
 
             # Update status
             transaction.approval_status = ApprovalStatus.REJECTED
@@ -337,9 +472,8 @@ class TransactionWorkflowService(BaseService):
             # Persist via repository
             self._tx_repo.update(transaction)
 
-            # Audit trail (dual: log + SQLite)
-            log_audit_event(
-                logger=self._logger,
+            # Audit trail (dual: log now, SQLite on the writer's next batch)
+            self._audit_writer.enqueue(
                 action="REJECT",
                 entity_type="Transaction",
                 entity_id=transaction_id,
@@ -349,17 +483,11 @@ class TransactionWorkflowService(BaseService):
                     "client_name": transaction.client_name,
                     "rejection_note": rejection_note or "",
                 },
-                conn=self._tx_repo.sqlite,
             )
 
-            # Send rejection email (non-blocking)
-            try:
-                self._email_service.send_status_update_email(transaction, "REJECTED")
-            except Exception as email_err:
-                self._logger.error(
-                    "Transaction rejected, but email notification failed: %s",
-                    str(email_err),
-                )
+            # Send rejection email in the background: SMTP latency must not
+            # delay the response, and a failure is only logged.
+            self._email_service.submit_status_update(transaction, "REJECTED")
 
             return ServiceResult(
                 success=True,
@@ -405,12 +533,9 @@ class TransactionWorkflowService(BaseService):
         """
         try:
             # --- RBAC CHECK: Only FINANCE and ADMIN can recalculate ---
-            if current_user.role not in (UserRole.FINANCE, UserRole.ADMIN):
-                return ServiceResult(
-                    success=False,
-                    error="Only FINANCE or ADMIN users can recalculate transactions.",
-                    status_code=403,
-                )
+            forbidden = self._require_approver(current_user, "recalculate")
+            if forbidden is not None:
+                return forbidden
 
             # 1. Retrieve the transaction object
             transaction: Optional[Transaction] = self._tx_repo.get_by_id(transaction_id)
@@ -441,15 +566,13 @@ class TransactionWorkflowService(BaseService):
             # 3. Persist changes via repository
             self._tx_repo.update(transaction)
 
-            # 4. Audit trail (dual: log + SQLite)
-            log_audit_event(
-                logger=self._logger,
+            # 4. Audit trail (dual: log now, SQLite on the writer's next batch)
+            self._audit_writer.enqueue(
                 action="RECALCULATE",
                 entity_type="Transaction",
                 entity_id=transaction_id,
                 user_id=current_user.id,
                 details={"recalculated_by": current_user.full_name},
-                conn=self._tx_repo.sqlite,
             )
 
             # 5. Return the full, updated transaction details
@@ -483,14 +606,19 @@ class TransactionWorkflowService(BaseService):
     ) -> ServiceResult:
         """Approve a transaction and archive the source file.
 
-        Orchestrates the full approval workflow (M5 — archival-first):
-        1. File archival (verify hash → rename → encrypt → move)
-        2. DB approval (status change, metrics recalculation, audit log)
+        Orchestrates the full approval workflow (M5 — archival before the
+        status write):
+        1. File archival (verify hash → rename → encrypt → move) on the
+           archival thread, overlapped with the read-only approval
+           preparation (RBAC, state check, hydration, recalculation).
+        2. DB approval write (status change, audit log, email) once both
+           have finished.
 
-        File archival runs first so that if it fails, the DB status
-        remains PENDING and the system is consistent.  If DB approval
-        fails after a successful archival, a warning is logged — the
-        file has already moved but the transaction stays PENDING.
+        Nothing is written to the DB until archival has succeeded, so if
+        it fails the transaction remains PENDING and the system is
+        consistent.  If the DB approval fails after a successful
+        archival, a warning is logged — the file has already moved but
+        the transaction stays PENDING.
 
         Parameters
         ----------
@@ -514,13 +642,24 @@ class TransactionWorkflowService(BaseService):
             On success, ``data`` contains ``{'message': str,
             'archived_path': str | None, 'sha256': str | None}``.
         """
-        # Step 1: File archival (hash verify → rename → encrypt → move)
-        archival_result = self._file_archival.archive_approved(
+        # Fast-fail RBAC so an unauthorized user never moves the file.
+        forbidden = self._require_approver(current_user, "approve")
+        if forbidden is not None:
+            return forbidden
+
+        # Step 1: File archival (hash verify → rename → encrypt → move) on
+        # the archival thread while the approval is prepared here.
+        archival_future: Future[ServiceResult] = self._archival_executor.submit(
+            self._file_archival.archive_approved,
             source_path=source_file_path,
             transaction_id=transaction_id,
             business_unit=business_unit,
             expected_sha256=expected_sha256,
         )
+        prepared: ServiceResult = self._prepare_approval(
+            transaction_id, current_user, data_payload,
+        )
+        archival_result: ServiceResult = archival_future.result()
 
         if not archival_result.success:
             return ServiceResult(
@@ -538,11 +677,11 @@ class TransactionWorkflowService(BaseService):
             archived_path = archival_result.data.get("archived_path")
             sha256 = archival_result.data.get("sha256")
 
-        # Step 2: DB approval (RBAC, state check, metrics, persist, audit, email)
-        db_result = self.approve_transaction(
-            transaction_id=transaction_id,
-            current_user=current_user,
-            data_payload=data_payload,
+        # Step 2: DB approval write (persist, audit, email)
+        db_result: ServiceResult = (
+            self._commit_approval(prepared.data, current_user, data_payload)
+            if prepared.success
+            else prepared
         )
         if not db_result.success:
             self._logger.warning(
@@ -612,6 +751,11 @@ class TransactionWorkflowService(BaseService):
             On success, ``data`` contains ``{'message': str,
             'archived_path': str | None, 'sha256': str | None}``.
         """
+        # Fast-fail RBAC so an unauthorized user never moves the file.
+        forbidden = self._require_approver(current_user, "reject")
+        if forbidden is not None:
+            return forbidden
+
         # Step 1: File archival (hash verify → rename → move — no encryption)
         archival_result = self._file_archival.archive_rejected(
             source_path=source_file_path,
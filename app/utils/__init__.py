@@ -7,7 +7,7 @@ normalize_keys``) remain supported.
 """
 
 from app.utils.audit import AuditEvent, log_audit_event
-from app.utils.general import convert_to_json_safe
+from app.utils.general import convert_to_json_safe, convert_via_orjson
 from app.utils.math_utils import calculate_irr, calculate_npv
 from app.utils.string_helpers import (
     normalize_keys,
@@ -19,6 +19,7 @@ __all__ = [
     "calculate_irr",
     "calculate_npv",
     "convert_to_json_safe",
+    "convert_via_orjson",
     "log_audit_event",
     "normalize_keys",
     "to_snake_case",
@@ -11,13 +11,19 @@ from __future__ import annotations
 import json
 import sqlite3
 from datetime import datetime, timezone
-from typing import Optional, Union
+from typing import Final, Optional, Sequence, Union
 
+import orjson
 from pydantic import BaseModel, Field
 
 from app.logger import StructuredLogger
 
-__all__ = ["AuditEvent", "log_audit_event", "persist_audit_event"]
+__all__ = [
+    "AuditEvent",
+    "log_audit_event",
+    "persist_audit_event",
+    "persist_audit_events",
+]
 
 # ---------------------------------------------------------------------------
 # Scalar type permitted inside the ``details`` mapping.  Kept deliberately
@@ -26,6 +32,11 @@ __all__ = ["AuditEvent", "log_audit_event", "persist_audit_event"]
 # ---------------------------------------------------------------------------
 DetailValue = Union[str, int, float, bool, None]
 
+_SQL_INSERT_AUDIT: Final[str] = """
+    INSERT INTO audit_log (timestamp, action, entity_type, entity_id, user_id, details)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
 
 class AuditEvent(BaseModel):
     """Schema-validated representation of a single audit trail entry.
@@ -142,18 +153,35 @@ def persist_audit_event(
         details=details or {},
     )
 
-    conn.execute(
-        """
-        INSERT INTO audit_log (timestamp, action, entity_type, entity_id, user_id, details)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
-        (
-            event.timestamp,
-            event.action,
-            event.entity_type,
-            event.entity_id,
-            event.user_id,
-            json.dumps(event.details, default=str),
-        ),
+    persist_audit_events(conn, [event])
+
+
+def persist_audit_events(
+    conn: sqlite3.Connection,
+    events: Sequence[AuditEvent],
+) -> None:
+    """Write already-validated audit events in one statement and commit.
+
+    Used by ``AuditWriterService`` to flush a buffered batch with a
+    single ``executemany`` and a single commit.  ``details`` is encoded
+    with orjson (compact, C-backed); the column stays TEXT.
+
+    Args:
+        conn: An open SQLite connection with write access.
+        events: Validated events, inserted in order.
+    """
+    conn.executemany(
+        _SQL_INSERT_AUDIT,
+        [
+            (
+                event.timestamp,
+                event.action,
+                event.entity_type,
+                event.entity_id,
+                event.user_id,
+                orjson.dumps(event.details, default=str).decode(),
+            )
+            for event in events
+        ],
     )
     conn.commit()
@@ -9,7 +9,9 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import Dict, List, Protocol, Union, runtime_checkable
 
-__all__ = ["convert_to_json_safe", "secure_clear_string"]
+import orjson
+
+__all__ = ["convert_to_json_safe", "convert_via_orjson", "secure_clear_string"]
 
 
 # ---------------------------------------------------------------------------
@@ -64,7 +66,8 @@ def convert_to_json_safe(data: JsonInputType) -> JsonSafeType:
     - ``Decimal`` -> ``float``
     - ``float`` NaN / Inf -> ``None``
     - Nested dicts and lists
-    - Pydantic models (via ``.model_dump()``)
+    - Pydantic models (field by field, without an intermediate
+      ``.model_dump()`` copy)
     """
     if data is None:
         return None
@@ -93,9 +96,14 @@ def convert_to_json_safe(data: JsonInputType) -> JsonSafeType:
     if isinstance(data, (list, tuple)):
         return [convert_to_json_safe(item) for item in data]
 
-    # Handle Pydantic models via structural typing (Protocol).
+    # Handle Pydantic models via structural typing (Protocol).  Pydantic
+    # v2 models list their fields on the class, so walk them directly
+    # instead of building a ``model_dump()`` dict and traversing it again.
     if isinstance(data, PydanticLike):
-        return convert_to_json_safe(data.model_dump())
+        fields = getattr(type(data), "model_fields", None)
+        if fields is None:
+            return convert_to_json_safe(data.model_dump())
+        return {name: convert_to_json_safe(getattr(data, name)) for name in fields}
 
     # Fallback: convert to string for any unrecognised type.
     # This is an intentional safety net — it prevents a hard crash when an
@@ -108,6 +116,35 @@ def convert_to_json_safe(data: JsonInputType) -> JsonSafeType:
     return str(data)
 
 
+def _orjson_default(obj: object) -> object:
+    """``default`` hook for :func:`orjson.dumps` used by :func:`convert_via_orjson`."""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, PydanticLike):
+        # Pydantic v2 keeps field values in ``__dict__``; orjson recurses
+        # into them and calls back here for nested models and Decimals.
+        return getattr(obj, "__dict__", None) or obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def convert_via_orjson(data: JsonInputType) -> JsonSafeType:
+    """Convert *data* to JSON-safe types with one orjson round trip.
+
+    Produces the same result as :func:`convert_to_json_safe` for
+    Decimal-heavy payloads such as ``FinancialMetricsResult``, but the
+    traversal runs in orjson's C code instead of a recursive Python
+    walk.  ``datetime`` / ``date`` become ISO strings and NaN / Inf
+    become ``None``.
+
+    Raises
+    ------
+    TypeError
+        If *data* contains a type outside ``JsonInputType``.  Unlike
+        :func:`convert_to_json_safe` there is no ``str()`` fallback.
+    """
+    return orjson.loads(orjson.dumps(data, default=_orjson_default))
+
+
 # ---------------------------------------------------------------------------
 # Security helpers
 # ---------------------------------------------------------------------------
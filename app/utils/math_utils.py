@@ -14,6 +14,9 @@ __all__: list[str] = ["calculate_npv", "calculate_irr"]
 # Threshold below which a Decimal value is treated as zero.
 _ZERO_THRESHOLD: Decimal = Decimal("1E-12")
 
+# Discount factor 1/(1+r)**t above which (1+r)**t is below _ZERO_THRESHOLD.
+_MAX_DISCOUNT_FACTOR: Decimal = 1 / _ZERO_THRESHOLD
+
 # Bounds for the Newton-Raphson IRR solver.  Rates outside this range
 # are economically meaningless and indicate divergence.
 _IRR_LOWER_BOUND: Decimal = Decimal("-0.999")
@@ -26,6 +29,18 @@ def _validate_finite(value: Decimal, name: str) -> None:
         raise ValueError(f"{name} must be a finite number, got {value!r}.")
 
 
+def _validate_cash_flows(cash_flows: list[Decimal]) -> None:
+    """Raise ``ValueError`` naming the first NaN/Inf entry of *cash_flows*.
+
+    The common all-finite case is one C-level ``is_finite`` pass; the
+    per-entry check only runs to build the error message.
+    """
+    if all(map(Decimal.is_finite, cash_flows)):
+        return
+    for i, cf in enumerate(cash_flows):
+        _validate_finite(cf, f"cash_flows[{i}]")
+
+
 def calculate_npv(rate: Decimal, cash_flows: list[Decimal]) -> Decimal:
     """Calculate Net Present Value.
 
@@ -49,8 +64,7 @@ def calculate_npv(rate: Decimal, cash_flows: list[Decimal]) -> Decimal:
 
     _validate_finite(rate, "rate")
 
-    for i, cf in enumerate(cash_flows):
-        _validate_finite(cf, f"cash_flows[{i}]")
+    _validate_cash_flows(cash_flows)
 
     if rate <= Decimal("-1"):
         raise ValueError(
@@ -58,14 +72,18 @@ def calculate_npv(rate: Decimal, cash_flows: list[Decimal]) -> Decimal:
             "A rate of -1.0 or below causes division by zero in discounting."
         )
 
+    if abs(rate) < _ZERO_THRESHOLD:
+        return sum(cash_flows, Decimal("0"))
+
+    # Carry the discount factor 1/(1+rate)**t forward with one multiply
+    # per period instead of a power and a division.
     npv: Decimal = Decimal("0")
-    rate_is_zero: bool = abs(rate) < _ZERO_THRESHOLD
+    step: Decimal = Decimal("1") / (Decimal("1") + rate)
+    factor: Decimal = Decimal("1")
 
-    for t, cf in enumerate(cash_flows):
-        if rate_is_zero:
-            npv += cf
-        else:
-            npv += cf / ((Decimal("1") + rate) ** t)
+    for cf in cash_flows:
+        npv += cf * factor
+        factor *= step
 
     return npv
 
@@ -101,8 +119,7 @@ def calculate_irr(
             f"cash_flows must contain at least 2 entries, got {len(cash_flows)}."
         )
 
-    for i, cf in enumerate(cash_flows):
-        _validate_finite(cf, f"cash_flows[{i}]")
+    _validate_cash_flows(cash_flows)
 
     # Pre-check: IRR requires at least one sign change in the cash flows.
     # Without both positive and negative values, no rate can drive NPV to
@@ -118,14 +135,19 @@ def calculate_irr(
         npv: Decimal = Decimal("0")
         d_npv: Decimal = Decimal("0")
 
+        # factor == 1/(1+guess)**t, advanced by one multiply per period.
+        # d(NPV)/d(guess) needs 1/(1+guess)**(t+1), i.e. factor * step.
+        step: Decimal = Decimal("1") / (Decimal("1") + guess)
+        factor: Decimal = Decimal("1")
+
         for t, cf in enumerate(cash_flows):
-            denominator: Decimal = (Decimal("1") + guess) ** t
-            if abs(denominator) < _ZERO_THRESHOLD:
+            if factor > _MAX_DISCOUNT_FACTOR:
                 # Denominator collapsed to zero -- cannot continue from here.
                 return None
-            npv += cf / denominator
+            npv += cf * factor
             if t > 0:
-                d_npv -= t * cf / ((Decimal("1") + guess) ** (t + 1))
+                d_npv -= t * cf * factor * step
+            factor *= step
 
         # If the derivative is essentially flat, Newton-Raphson cannot step.
         if abs(d_npv) < _ZERO_THRESHOLD:
@@ -74,6 +74,8 @@ def main() -> None:
         db=db,
         logger=StructuredLogger(name="session_cache"),
     )
+    # Derive the session key off the UI thread while the login form loads.
+    session_cache.warm_up()
 
     # ------------------------------------------------------------------
     # 6. Service Container (repositories + services, single composition root)
@@ -84,6 +86,10 @@ def main() -> None:
         session=session,
         session_cache=session_cache,
     )
+    # Batches audit_log writes off the UI thread; stopped (and flushed)
+    # before the database closes below.
+    audit_writer = services["audit_writer_service"]
+    audit_writer.start()
 
     # ------------------------------------------------------------------
     # 7. Module Registry (plug-and-play modules)
@@ -141,6 +147,9 @@ def main() -> None:
         # Guarantees db.close() runs whether mainloop() exits cleanly
         # or raises an exception.  The atexit handler above is a second
         # safety net for harder crashes; this is the primary path.
+        # Queued emails may still read users, so they finish first.
+        services["email_service"].shutdown()
+        audit_writer.stop()
         db.close()
         logger.info("FinanceGatekeeper shut down.")
 
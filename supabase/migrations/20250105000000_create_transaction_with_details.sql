@@ -0,0 +1,104 @@
+-- ============================================================================
+-- Migration 005: Atomic Transaction Creation RPC
+-- ============================================================================
+-- Creates create_transaction_with_details(), which inserts a transaction
+-- header and all of its fixed_costs / recurring_services rows in a single
+-- Postgres transaction.
+--
+-- Problem: save_transaction() inserted the header and each detail table
+--   with separate PostgREST requests (3 round-trips), and on a detail
+--   failure issued up to 3 more DELETEs as a compensating rollback — which
+--   could itself fail and leave orphaned rows.
+--
+-- Fix: one RPC call.  Any failure aborts the whole function, so Postgres
+--   rolls back the header and every detail row together.
+--
+-- Parameters (JSONB, as sent by TransactionRepository.create_with_details):
+--   p_tx                 — header object keyed by transactions column name
+--   p_fixed_costs        — array of fixed_costs objects (no id/transaction_id)
+--   p_recurring_services — array of recurring_services objects (same)
+--
+-- Returns the inserted transactions row (server defaults populated).
+--
+-- SECURITY INVOKER: the caller's RLS INSERT policies from migration 004
+-- still apply to all three tables.
+--
+-- Run this in the Supabase SQL Editor (Dashboard > SQL Editor > New Query).
+-- ============================================================================
+
+CREATE OR REPLACE FUNCTION public.create_transaction_with_details(
+    p_tx                 JSONB,
+    p_fixed_costs        JSONB DEFAULT '[]'::jsonb,
+    p_recurring_services JSONB DEFAULT '[]'::jsonb
+)
+RETURNS public.transactions
+LANGUAGE plpgsql
+SECURITY INVOKER
+SET search_path = public
+AS $$
+DECLARE
+    header public.transactions;
+BEGIN
+    -- Header: NULL keys are stripped so the NOT NULL column defaults below
+    -- apply exactly as they would for a plain INSERT omitting the column.
+    INSERT INTO public.transactions
+    SELECT (jsonb_populate_record(
+        NULL::public.transactions,
+        jsonb_build_object(
+            'unidad_negocio',      '',
+            'client_name',         '',
+            'salesman',            '',
+            'mrc_currency',        'PEN',
+            'nrc_currency',        'PEN',
+            'aplica_carta_fianza', FALSE,
+            'approval_status',     'PENDING',
+            'created_at',          now(),
+            'updated_at',          now()
+        ) || jsonb_strip_nulls(p_tx)
+    )).*
+    RETURNING * INTO header;
+
+    -- Details: ids come from BIGSERIAL, transaction_id from the header.
+    INSERT INTO public.fixed_costs (
+        transaction_id, categoria, tipo_servicio, ticket, ubicacion,
+        cantidad, costo_unitario_original, costo_unitario_currency,
+        costo_unitario_pen, periodo_inicio, duracion_meses
+    )
+    SELECT
+        header.id, fc.categoria, fc.tipo_servicio, fc.ticket, fc.ubicacion,
+        fc.cantidad, fc.costo_unitario_original,
+        COALESCE(fc.costo_unitario_currency, 'USD'),
+        fc.costo_unitario_pen,
+        COALESCE(fc.periodo_inicio, 0),
+        COALESCE(fc.duracion_meses, 1)
+    FROM jsonb_populate_recordset(
+        NULL::public.fixed_costs, COALESCE(p_fixed_costs, '[]'::jsonb)
+    ) AS fc;
+
+    INSERT INTO public.recurring_services (
+        transaction_id, tipo_servicio, nota, ubicacion, quantity,
+        price_original, price_currency, price_pen,
+        cost_unit_1_original, cost_unit_2_original, cost_unit_currency,
+        cost_unit_1_pen, cost_unit_2_pen, proveedor
+    )
+    SELECT
+        header.id, rs.tipo_servicio, rs.nota, rs.ubicacion, rs.quantity,
+        rs.price_original, COALESCE(rs.price_currency, 'PEN'), rs.price_pen,
+        rs.cost_unit_1_original, rs.cost_unit_2_original,
+        COALESCE(rs.cost_unit_currency, 'USD'),
+        rs.cost_unit_1_pen, rs.cost_unit_2_pen, rs.proveedor
+    FROM jsonb_populate_recordset(
+        NULL::public.recurring_services, COALESCE(p_recurring_services, '[]'::jsonb)
+    ) AS rs;
+
+    RETURN header;
+END;
+$$;
+
+-- ============================================================================
+-- NOTES:
+-- - Until this migration is applied the desktop app falls back to the
+--   previous per-table inserts (PostgREST reports the function as missing).
+-- - Numeric values may arrive as JSON strings (exact Decimal text); the
+--   record population casts them to NUMERIC without float rounding.
+-- ============================================================================